@@ -0,0 +1,70 @@
+"""Default primary keys to time-ordered UUIDv7.
+
+Revision ID: 003_uuid_v7
+Revises: 002_add_name
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003_uuid_v7"
+down_revision: Union[str, None] = "002_add_name"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = [
+    "investor_profiles",
+    "properties",
+    "property_features",
+    "property_documents",
+    "consents",
+    "lead_notes",
+    "stage_history",
+    "deal_matches",
+    "call_sessions",
+    "call_transcripts",
+]
+
+
+def upgrade() -> None:
+    # UUIDv7 generator in plain SQL (no pg_uuidv7 extension needed on RDS):
+    # overwrite the first 48 bits of a random UUID with the millisecond
+    # timestamp and flip the version nibble from 4 to 7.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(
+                                int8send(
+                                    floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint
+                                )
+                                FROM 3
+                            )
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$ LANGUAGE sql VOLATILE
+        """
+    )
+
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT uuid_generate_v7()")
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
@@ -0,0 +1,54 @@
+"""Add (sort column, id) indexes for keyset pagination.
+
+Revision ID: 004_keyset_indexes
+Revises: 003_uuid_v7
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004_keyset_indexes"
+down_revision: Union[str, None] = "003_uuid_v7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One index per sortable column in InvestorRepository.search_leads,
+    # matching its ORDER BY (sort column, id)
+    op.create_index(
+        "idx_investor_profiles_created_at_id",
+        "investor_profiles",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "idx_investor_profiles_lead_score_id",
+        "investor_profiles",
+        [sa.text("lead_score DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "idx_investor_profiles_capital_id",
+        "investor_profiles",
+        [sa.text("COALESCE(capital_available, 0) DESC"), sa.text("id DESC")],
+    )
+    # Covered by idx_investor_profiles_lead_score_id
+    op.drop_index("idx_investor_profiles_lead_score", table_name="investor_profiles")
+
+    # PropertyRepository.get_active_deals / search_deals
+    op.create_index(
+        "idx_properties_created_at_id",
+        "properties",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_properties_created_at_id", table_name="properties")
+    op.create_index("idx_investor_profiles_lead_score", "investor_profiles", ["lead_score"])
+    op.drop_index("idx_investor_profiles_capital_id", table_name="investor_profiles")
+    op.drop_index("idx_investor_profiles_lead_score_id", table_name="investor_profiles")
+    op.drop_index("idx_investor_profiles_created_at_id", table_name="investor_profiles")
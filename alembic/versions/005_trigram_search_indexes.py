@@ -0,0 +1,43 @@
+"""Add pg_trgm GIN indexes for substring search.
+
+Revision ID: 005_trigram_search
+Revises: 004_keyset_indexes
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005_trigram_search"
+down_revision: Union[str, None] = "004_keyset_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # search_leads filters with phone LIKE '%q%' and search_deals with
+    # name/summary ILIKE '%q%'; a leading wildcard can't use a B-tree, but the
+    # planner will use these trigram indexes for both LIKE and ILIKE.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.execute(
+        "CREATE INDEX idx_investor_profiles_phone_trgm "
+        "ON investor_profiles USING GIN (phone gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX idx_properties_name_trgm "
+        "ON properties USING GIN (name gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX idx_properties_summary_trgm "
+        "ON properties USING GIN (summary gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_properties_summary_trgm", table_name="properties")
+    op.drop_index("idx_properties_name_trgm", table_name="properties")
+    op.drop_index("idx_investor_profiles_phone_trgm", table_name="investor_profiles")
+    op.execute("DROP EXTENSION IF EXISTS pg_trgm")
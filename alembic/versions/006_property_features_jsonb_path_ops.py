@@ -0,0 +1,40 @@
+"""Rebuild the property_features JSONB index with jsonb_path_ops.
+
+Revision ID: 006_features_path_ops
+Revises: 005_trigram_search
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006_features_path_ops"
+down_revision: Union[str, None] = "005_trigram_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Feature lookups use containment (features @> '{...}'), which is all
+    # jsonb_path_ops supports; in exchange the index is smaller and faster
+    # than the default jsonb_ops.
+    op.drop_index("idx_property_features_jsonb", table_name="property_features")
+    op.create_index(
+        "idx_property_features_jsonb",
+        "property_features",
+        ["features"],
+        postgresql_using="gin",
+        postgresql_ops={"features": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_property_features_jsonb", table_name="property_features")
+    op.create_index(
+        "idx_property_features_jsonb",
+        "property_features",
+        ["features"],
+        postgresql_using="gin",
+    )
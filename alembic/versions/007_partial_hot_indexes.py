@@ -0,0 +1,41 @@
+"""Add partial indexes for active deals and open pipeline stages.
+
+Revision ID: 007_partial_indexes
+Revises: 006_features_path_ops
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007_partial_indexes"
+down_revision: Union[str, None] = "006_features_path_ops"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # get_active_deals: WHERE status = 'active' ORDER BY created_at DESC, id DESC
+    op.create_index(
+        "idx_properties_active_created_at",
+        "properties",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("status = 'active'"),
+    )
+
+    # Pipeline views rank leads that are still in play; 'closed' is the
+    # only terminal stage
+    op.create_index(
+        "idx_investor_profiles_open_score",
+        "investor_profiles",
+        [sa.text("lead_score DESC"), sa.text("created_at DESC")],
+        postgresql_where=sa.text("stage <> 'closed'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_investor_profiles_open_score", table_name="investor_profiles")
+    op.drop_index("idx_properties_active_created_at", table_name="properties")
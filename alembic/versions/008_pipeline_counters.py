@@ -0,0 +1,76 @@
+"""Add trigger-maintained pipeline_counters.
+
+Revision ID: 008_pipeline_counters
+Revises: 007_partial_indexes
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008_pipeline_counters"
+down_revision: Union[str, None] = "007_partial_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pipeline_counters",
+        sa.Column("stage", sa.Text(), primary_key=True),
+        sa.Column("n", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("lead_score_sum", sa.BigInteger(), server_default="0", nullable=False),
+    )
+
+    # Block writers until the trigger is in place so the backfill can't miss rows
+    op.execute("LOCK TABLE investor_profiles IN SHARE ROW EXCLUSIVE MODE")
+    op.execute(
+        """
+        INSERT INTO pipeline_counters (stage, n, lead_score_sum)
+        SELECT stage, count(*), coalesce(sum(lead_score), 0)
+        FROM investor_profiles
+        GROUP BY stage
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION pipeline_counters_sync() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE pipeline_counters
+                SET n = n - 1,
+                    lead_score_sum = lead_score_sum - OLD.lead_score
+                WHERE stage = OLD.stage::text;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO pipeline_counters (stage, n, lead_score_sum)
+                VALUES (NEW.stage::text, 1, NEW.lead_score)
+                ON CONFLICT (stage) DO UPDATE
+                SET n = pipeline_counters.n + 1,
+                    lead_score_sum = pipeline_counters.lead_score_sum
+                        + EXCLUDED.lead_score_sum;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER investor_profiles_pipeline_counters
+        AFTER INSERT OR DELETE OR UPDATE OF stage, lead_score ON investor_profiles
+        FOR EACH ROW EXECUTE FUNCTION pipeline_counters_sync()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS investor_profiles_pipeline_counters ON investor_profiles"
+    )
+    op.execute("DROP FUNCTION IF EXISTS pipeline_counters_sync()")
+    op.drop_table("pipeline_counters")
@@ -0,0 +1,69 @@
+"""Deduplicate consents and add a unique index for idempotent inserts.
+
+Consents are the TCPA audit trail, so the repeated rows are moved to
+consents_duplicates_archive rather than deleted; downgrade moves them back.
+
+Revision ID: 009_consent_dedup
+Revises: 008_pipeline_counters
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009_consent_dedup"
+down_revision: Union[str, None] = "008_pipeline_counters"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE TABLE consents_duplicates_archive (LIKE consents INCLUDING DEFAULTS)")
+
+    # Keep the earliest record of each repeated consent in consents
+    op.execute(
+        """
+        WITH moved AS (
+            DELETE FROM consents c
+            USING consents keep
+            WHERE c.investor_id = keep.investor_id
+              AND md5(c.consent_text) = md5(keep.consent_text)
+              AND coalesce(c.ip_address, '') = coalesce(keep.ip_address, '')
+              AND coalesce(c.user_agent, '') = coalesce(keep.user_agent, '')
+              AND (c.created_at, c.id) > (keep.created_at, keep.id)
+            RETURNING c.*
+        )
+        INSERT INTO consents_duplicates_archive
+        SELECT * FROM moved
+        """
+    )
+
+    # consent_text is hashed to keep index entries small; NULL ip/user agent
+    # are folded to '' so they still collide
+    op.create_index(
+        "idx_consents_dedup",
+        "consents",
+        [
+            "investor_id",
+            sa.text("md5(consent_text)"),
+            sa.text("coalesce(ip_address, '')"),
+            sa.text("coalesce(user_agent, '')"),
+        ],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_consents_dedup", table_name="consents")
+    # Archived rows whose investor has since been deleted went with it
+    op.execute(
+        """
+        INSERT INTO consents
+        SELECT a.* FROM consents_duplicates_archive a
+        WHERE EXISTS (SELECT 1 FROM investor_profiles i WHERE i.id = a.investor_id)
+        """
+    )
+    op.drop_table("consents_duplicates_archive")
@@ -0,0 +1,62 @@
+"""Add covering indexes for stage and status list queries.
+
+Revision ID: 010_covering_indexes
+Revises: 009_consent_dedup
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010_covering_indexes"
+down_revision: Union[str, None] = "009_consent_dedup"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Stage-filtered lead lists and counts; id closes the sort for keyset
+    # paging and the INCLUDE payload covers the list columns (index-only
+    # scans once VACUUM has marked the pages all-visible)
+    op.create_index(
+        "idx_investor_profiles_stage_cover",
+        "investor_profiles",
+        ["stage", sa.text("lead_score DESC"), sa.text("id DESC")],
+        postgresql_include=["name", "phone", "created_at", "capital_available"],
+    )
+    # Leading column of the covering index; no longer needed on its own
+    op.drop_index("idx_investor_profiles_stage", table_name="investor_profiles")
+
+    op.create_index(
+        "idx_properties_status_cover",
+        "properties",
+        ["status", sa.text("created_at DESC"), sa.text("id DESC")],
+        postgresql_include=["name", "deal_type", "minimum_investment"],
+    )
+    op.drop_index("idx_properties_status", table_name="properties")
+    # The cover serves WHERE status = 'active' ORDER BY created_at DESC, id DESC
+    # on its own (007's partial index), and deal lists always filter on
+    # status, so 004's unfiltered (created_at, id) index goes unused
+    op.drop_index("idx_properties_active_created_at", table_name="properties")
+    op.drop_index("idx_properties_created_at_id", table_name="properties")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "idx_properties_created_at_id",
+        "properties",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "idx_properties_active_created_at",
+        "properties",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("status = 'active'"),
+    )
+    op.create_index("idx_properties_status", "properties", ["status"])
+    op.drop_index("idx_properties_status_cover", table_name="properties")
+    op.create_index("idx_investor_profiles_stage", "investor_profiles", ["stage"])
+    op.drop_index("idx_investor_profiles_stage_cover", table_name="investor_profiles")
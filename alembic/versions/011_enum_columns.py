@@ -0,0 +1,147 @@
+"""Store closed-set status columns as native Postgres ENUMs.
+
+Revision ID: 011_enum_columns
+Revises: 010_covering_indexes
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "011_enum_columns"
+down_revision: Union[str, None] = "010_covering_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, enum type, values, server default, original VARCHAR length)
+ENUM_COLUMNS = [
+    (
+        "investor_profiles",
+        "stage",
+        "pipeline_stage",
+        (
+            "new_lead",
+            "call_dispatched",
+            "call_completed",
+            "insights_extracted",
+            "deals_matched",
+            "under_review",
+            "closed",
+        ),
+        "new_lead",
+        50,
+    ),
+    (
+        "investor_profiles",
+        "qualification_bucket",
+        "qualification_bucket",
+        ("active_intro", "nurture", "not_qualified"),
+        None,
+        50,
+    ),
+    ("properties", "status", "deal_status", ("active", "closed", "paused"), "active", 20),
+    (
+        "deal_matches",
+        "status",
+        "match_status",
+        ("pending", "presented", "accepted", "rejected"),
+        "pending",
+        50,
+    ),
+    (
+        "call_sessions",
+        "status",
+        "call_status",
+        ("initiated", "ringing", "answered", "completed", "failed"),
+        "initiated",
+        50,
+    ),
+]
+
+# Postgres refuses to change the type of a column named in a trigger's
+# UPDATE OF list, so the pipeline counter trigger is recreated around the
+# conversion
+DROP_COUNTER_TRIGGER = (
+    "DROP TRIGGER investor_profiles_pipeline_counters ON investor_profiles"
+)
+CREATE_COUNTER_TRIGGER = """
+    CREATE TRIGGER investor_profiles_pipeline_counters
+    AFTER INSERT OR DELETE OR UPDATE OF stage, lead_score ON investor_profiles
+    FOR EACH ROW EXECUTE FUNCTION pipeline_counters_sync()
+"""
+
+
+# Partial indexes from 007 whose predicates compare a converted column to a
+# literal. Postgres can't carry such a predicate across the type change (the
+# rewritten cast isn't IMMUTABLE), so they are rebuilt around it. (007's
+# idx_properties_active_created_at was dropped in 010.)
+# (name, table, columns, predicate)
+PARTIAL_INDEXES = [
+    (
+        "idx_investor_profiles_open_score",
+        "investor_profiles",
+        ["lead_score DESC", "created_at DESC"],
+        "stage <> 'closed'",
+    ),
+]
+
+
+def drop_partial_indexes() -> None:
+    for name, table, _, _ in PARTIAL_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def create_partial_indexes() -> None:
+    for name, table, columns, where in PARTIAL_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [sa.text(column) for column in columns],
+            postgresql_where=sa.text(where),
+        )
+
+
+def upgrade() -> None:
+    op.execute(DROP_COUNTER_TRIGGER)
+    drop_partial_indexes()
+
+    for table, column, type_name, values, default, _ in ENUM_COLUMNS:
+        postgresql.ENUM(*values, name=type_name).create(op.get_bind())
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {type_name} USING {column}::{type_name}"
+        )
+        if default is not None:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'"
+            )
+
+    create_partial_indexes()
+    op.execute(CREATE_COUNTER_TRIGGER)
+
+
+def downgrade() -> None:
+    op.execute(DROP_COUNTER_TRIGGER)
+    drop_partial_indexes()
+
+    for table, column, type_name, _, default, length in reversed(ENUM_COLUMNS):
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE VARCHAR({length}) USING {column}::text"
+        )
+        if default is not None:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'"
+            )
+        op.execute(f"DROP TYPE {type_name}")
+
+    create_partial_indexes()
+    op.execute(CREATE_COUNTER_TRIGGER)
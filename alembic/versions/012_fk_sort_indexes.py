@@ -0,0 +1,47 @@
+"""Add (investor_id, timestamp DESC) indexes for per-lead child lists.
+
+Revision ID: 012_fk_sort_indexes
+Revises: 011_enum_columns
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012_fk_sort_indexes"
+down_revision: Union[str, None] = "011_enum_columns"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, new composite index, sort column, single-column index it replaces)
+FK_SORT_INDEXES = [
+    ("lead_notes", "idx_lead_notes_investor_created", "created_at", "idx_lead_notes_investor_id"),
+    (
+        "stage_history",
+        "idx_stage_history_investor_changed",
+        "changed_at",
+        "idx_stage_history_investor_id",
+    ),
+    (
+        "deal_matches",
+        "idx_deal_matches_investor_created",
+        "created_at",
+        "idx_deal_matches_investor_id",
+    ),
+]
+
+
+def upgrade() -> None:
+    for table, index, sort_column, old_index in FK_SORT_INDEXES:
+        op.create_index(index, table, ["investor_id", sa.text(f"{sort_column} DESC")])
+        # investor_id is the leading column of the new index
+        op.drop_index(old_index, table_name=table)
+
+
+def downgrade() -> None:
+    for table, index, _, old_index in reversed(FK_SORT_INDEXES):
+        op.create_index(old_index, table, ["investor_id"])
+        op.drop_index(index, table_name=table)
@@ -0,0 +1,39 @@
+"""Store call transcript timings and confidence as double precision.
+
+Revision ID: 013_transcript_floats
+Revises: 012_fk_sort_indexes
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "013_transcript_floats"
+down_revision: Union[str, None] = "012_fk_sort_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = ["start_time", "end_time", "confidence"]
+
+
+def upgrade() -> None:
+    for column in COLUMNS:
+        op.alter_column(
+            "call_transcripts",
+            column,
+            type_=sa.Double(),
+            postgresql_using=f"{column}::double precision",
+        )
+
+
+def downgrade() -> None:
+    for column in COLUMNS:
+        op.alter_column(
+            "call_transcripts",
+            column,
+            type_=sa.Integer(),
+            postgresql_using=f"round({column})::integer",
+        )
@@ -0,0 +1,35 @@
+"""Store deal match similarity scores as double precision.
+
+Revision ID: 014_similarity_double
+Revises: 013_transcript_floats
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "014_similarity_double"
+down_revision: Union[str, None] = "013_transcript_floats"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "deal_matches",
+        "similarity_score",
+        type_=sa.Double(),
+        postgresql_using="similarity_score::double precision",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "deal_matches",
+        "similarity_score",
+        type_=sa.Numeric(5, 4),
+        postgresql_using="round(similarity_score::numeric, 4)",
+    )
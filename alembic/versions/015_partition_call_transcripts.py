@@ -0,0 +1,74 @@
+"""Hash-partition call_transcripts by call_session_id.
+
+Revision ID: 015_partition_transcripts
+Revises: 014_similarity_double
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "015_partition_transcripts"
+down_revision: Union[str, None] = "014_similarity_double"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONS = 16
+
+COLUMNS = "id, call_session_id, speaker, content, start_time, end_time, confidence, created_at"
+
+
+def _create_table(partitioned: bool) -> None:
+    # The partition key has to be part of the primary key; leading with it
+    # also lets the PK index serve per-call lookups
+    primary_key = "(call_session_id, id)" if partitioned else "(id)"
+    partition_by = " PARTITION BY HASH (call_session_id)" if partitioned else ""
+    op.execute(
+        f"""
+        CREATE TABLE call_transcripts (
+            id UUID NOT NULL DEFAULT uuid_generate_v7(),
+            call_session_id UUID NOT NULL
+                REFERENCES call_sessions (id) ON DELETE CASCADE,
+            speaker VARCHAR(50) NOT NULL,
+            content TEXT NOT NULL,
+            start_time DOUBLE PRECISION,
+            end_time DOUBLE PRECISION,
+            confidence DOUBLE PRECISION,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            PRIMARY KEY {primary_key}
+        ){partition_by}
+        """
+    )
+
+
+def _swap_table(partitioned: bool) -> None:
+    op.execute("ALTER TABLE call_transcripts RENAME TO call_transcripts_old")
+    op.execute(
+        "ALTER TABLE call_transcripts_old "
+        "RENAME CONSTRAINT call_transcripts_pkey TO call_transcripts_old_pkey"
+    )
+
+    _create_table(partitioned)
+    if partitioned:
+        for remainder in range(PARTITIONS):
+            op.execute(
+                f"CREATE TABLE call_transcripts_p{remainder} "
+                f"PARTITION OF call_transcripts "
+                f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})"
+            )
+
+    op.execute(
+        f"INSERT INTO call_transcripts ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM call_transcripts_old"
+    )
+    op.execute("DROP TABLE call_transcripts_old")
+
+
+def upgrade() -> None:
+    _swap_table(partitioned=True)
+
+
+def downgrade() -> None:
+    _swap_table(partitioned=False)
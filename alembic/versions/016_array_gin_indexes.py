@@ -0,0 +1,36 @@
+"""Add GIN indexes on set-valued ARRAY columns used for matching.
+
+Revision ID: 016_array_gin_indexes
+Revises: 015_partition_transcripts
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "016_array_gin_indexes"
+down_revision: Union[str, None] = "015_partition_transcripts"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_investor_profiles_preferences_gin",
+        "investor_profiles",
+        ["investment_preferences"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "idx_properties_risk_factors_gin",
+        "properties",
+        ["risk_factors"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_properties_risk_factors_gin", table_name="properties")
+    op.drop_index("idx_investor_profiles_preferences_gin", table_name="investor_profiles")
@@ -0,0 +1,37 @@
+"""Add partial indexes for pending matches and active deals by type.
+
+Revision ID: 017_partial_status_indexes
+Revises: 016_array_gin_indexes
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "017_partial_status_indexes"
+down_revision: Union[str, None] = "016_array_gin_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_deal_matches_pending",
+        "deal_matches",
+        ["investor_id"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "idx_properties_active_deal_type",
+        "properties",
+        ["deal_type"],
+        postgresql_where=sa.text("status = 'active'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_properties_active_deal_type", table_name="properties")
+    op.drop_index("idx_deal_matches_pending", table_name="deal_matches")
@@ -0,0 +1,33 @@
+"""Compress transcript text with LZ4 instead of pglz.
+
+Revision ID: 018_transcript_lz4
+Revises: 017_partial_status_indexes
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "018_transcript_lz4"
+down_revision: Union[str, None] = "017_partial_status_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Long transcript text columns (requires PostgreSQL 14+). Only values
+# written from now on use the new codec; existing values stay pglz.
+COLUMNS = [
+    ("call_transcripts", "content"),
+    ("call_sessions", "transcript"),
+]
+
+
+def upgrade() -> None:
+    for table, column in COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    for table, column in COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION pglz")
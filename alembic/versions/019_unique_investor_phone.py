@@ -0,0 +1,51 @@
+"""Make investor phone numbers unique.
+
+Revision ID: 019_unique_investor_phone
+Revises: 018_transcript_lz4
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "019_unique_investor_phone"
+down_revision: Union[str, None] = "018_transcript_lz4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # submit_lead upserts on phone (ON CONFLICT needs a unique index). Built
+    # concurrently so lead submissions keep flowing; fails if duplicate
+    # phones already exist, which must then be merged by hand first.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_investor_profiles_phone_unique",
+            "investor_profiles",
+            ["phone"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        # Redundant with the unique index
+        op.drop_index(
+            "idx_investor_profiles_phone",
+            table_name="investor_profiles",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_investor_profiles_phone",
+            "investor_profiles",
+            ["phone"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_investor_profiles_phone_unique",
+            table_name="investor_profiles",
+            postgresql_concurrently=True,
+        )
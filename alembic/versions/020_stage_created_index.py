@@ -0,0 +1,40 @@
+"""Add a (stage, created_at, id) index for stage-filtered lead lists.
+
+Revision ID: 020_stage_created_index
+Revises: 019_unique_investor_phone
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "020_stage_created_index"
+down_revision: Union[str, None] = "019_unique_investor_phone"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # list_leads' default order (created_at DESC, id DESC) under a stage
+    # filter: walk one stage's slice in order and stop at LIMIT instead of
+    # sorting every lead in the stage. Score order is already served by
+    # idx_investor_profiles_stage_cover and phone search by the trigram index.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_investor_profiles_stage_created_id",
+            "investor_profiles",
+            ["stage", sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_investor_profiles_stage_created_id",
+            table_name="investor_profiles",
+            postgresql_concurrently=True,
+        )
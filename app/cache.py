@@ -0,0 +1,177 @@
+"""In-process TTL cache for values that may be briefly stale, plus a shared response cache."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, Tuple, cast
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import get_settings
+
+settings = get_settings()
+
+
+class TTLCache:
+    """
+    Minimal process-local cache with per-entry expiry.
+    Each worker keeps its own copy, so staleness is bounded by ttl only.
+
+    Holds at most max_size entries, evicting the least recently used, and
+    sweeps out expired entries once per ttl so keys that are never read
+    again do not pile up.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 1024):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._next_prune = time.monotonic() + ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache a value for ttl seconds."""
+        now = time.monotonic()
+        if now >= self._next_prune:
+            self._prune(now)
+        self._entries[key] = (now + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *keys: str) -> None:
+        """Drop entries so the next get() recomputes them."""
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def _prune(self, now: float) -> None:
+        """Drop every expired entry."""
+        for key in [k for k, (expires_at, _) in self._entries.items() if expires_at < now]:
+            del self._entries[key]
+        self._next_prune = now + self.ttl
+
+
+class ResponseCache:
+    """
+    Serialized-response cache shared by all workers through Redis.
+
+    Falls back to a process-local TTLCache of at most local_max_size
+    entries when no Redis client is given. Redis errors are treated as
+    misses so an outage only costs the cache.
+    """
+
+    LOCK_TTL = 10  # seconds a recompute may hold the lock
+    LOCK_WAIT = 0.05  # seconds between polls while another worker recomputes
+    LOCK_POLLS = 40
+
+    def __init__(self, ttl: int, redis: Optional[Redis] = None, local_max_size: int = 1024):
+        self.ttl = ttl
+        self._redis = redis
+        self._local = TTLCache(ttl, max_size=local_max_size)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a cached payload, or None on miss."""
+        if self._redis is None:
+            return self._local.get(key)
+        try:
+            # The client is created without decode_responses, so values are bytes
+            return cast(Optional[bytes], await self._redis.get(key))
+        except RedisError:
+            return None
+
+    async def set(self, key: str, value: bytes) -> None:
+        """Cache a payload for ttl seconds."""
+        if self._redis is None:
+            self._local.set(key, value)
+            return
+        try:
+            await self._redis.set(key, value, ex=self.ttl)
+        except RedisError:
+            pass
+
+    async def invalidate(self, *keys: str) -> None:
+        """Drop payloads so the next read recomputes them."""
+        if self._redis is None:
+            self._local.invalidate(*keys)
+            return
+        try:
+            await self._redis.delete(*keys)
+        except RedisError:
+            pass
+
+    async def get_or_compute(
+        self, key: str, compute: Callable[[], Awaitable[bytes]]
+    ) -> bytes:
+        """
+        Return the cached payload, computing and storing it on a miss.
+
+        Only the worker that wins a SET NX lock recomputes; the others poll
+        briefly for its result instead of all hitting the database at once.
+        """
+        cached = await self.get(key)
+        if cached is not None:
+            return cached
+
+        lock_key = f"{key}:lock"
+        locked = await self._acquire(lock_key)
+        if not locked:
+            for _ in range(self.LOCK_POLLS):
+                await asyncio.sleep(self.LOCK_WAIT)
+                cached = await self.get(key)
+                if cached is not None:
+                    return cached
+
+        try:
+            value = await compute()
+            await self.set(key, value)
+            return value
+        finally:
+            if locked:
+                await self.invalidate(lock_key)
+
+    async def _acquire(self, lock_key: str) -> bool:
+        """Take the recompute lock; without Redis there is nothing to coordinate."""
+        if self._redis is None:
+            return True
+        try:
+            return bool(await self._redis.set(lock_key, b"1", nx=True, ex=self.LOCK_TTL))
+        except RedisError:
+            return True
+
+
+# One connection pool for every shared cache; None without REDIS_URL
+redis_client: Optional[Redis] = Redis.from_url(settings.redis_url) if settings.redis_url else None
+
+
+async def close_redis() -> None:
+    """Close the Redis connection pool (application shutdown)."""
+    if redis_client is not None:
+        await redis_client.aclose()
+
+
+# Planner row estimates per table; they only move on ANALYZE, and are only
+# used as approximate totals, so per-process staleness is harmless
+row_estimate_cache = TTLCache(ttl=settings.row_estimate_ttl)
+
+# Serialized endpoint responses shared across workers
+response_cache = ResponseCache(ttl=settings.stats_response_ttl, redis=redis_client)
+ADMIN_STATS_KEY = "admin:stats:v1"
+
+# OpenAI deal extractions keyed by model, prompt version and document hash.
+# Entries can carry a whole document's text, so the per-process fallback
+# keeps only the most recent few.
+extraction_cache = ResponseCache(
+    ttl=settings.extraction_cache_ttl, redis=redis_client, local_max_size=64
+)
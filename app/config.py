@@ -15,6 +15,13 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "postgresql://localhost:5432/blackkeyx"
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30  # seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # seconds; drop connections before LB/idle cutoffs
+    db_statement_cache_size: int = 1024  # prepared statements per connection
+    db_warmup_connections: int = 20  # opened at startup, capped at db_pool_size
+    db_pgbouncer: bool = False  # transaction-pooled PgBouncer in front of Postgres
 
     # AWS S3
     aws_access_key_id: str = ""
@@ -28,17 +35,23 @@ class Settings(BaseSettings):
     # Admin Authentication
     admin_password: str = "changeme"
 
+    # Caching
+    redis_url: str = ""  # shared response cache; empty = per-process memory
+    stats_response_ttl: int = 45  # seconds; cached /admin/stats payload
+    extraction_cache_ttl: int = 86400  # seconds; OpenAI deal extractions
+    row_estimate_ttl: int = 300  # seconds; planner row estimates for list totals
+
     # Application
     debug: bool = False
     cors_origins: List[str] = ["http://localhost:3000"]
 
     @property
     def async_database_url(self) -> str:
-        """Convert database URL to async version for asyncpg."""
-        url = self.database_url
-        if url.startswith("postgresql://"):
-            return url.replace("postgresql://", "postgresql+asyncpg://", 1)
-        return url
+        """Convert database URL to the asyncpg driver, whatever scheme it was given with."""
+        scheme, sep, rest = self.database_url.partition("://")
+        if sep and scheme.split("+")[0] in ("postgres", "postgresql"):
+            return f"postgresql+asyncpg://{rest}"
+        return self.database_url
 
 
 @lru_cache
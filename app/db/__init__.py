@@ -1,10 +1,11 @@
 """Database layer."""
 
-from app.db.session import async_session_factory, engine, get_db, init_db
+from app.db.session import close_db, get_db, get_engine, get_session_factory, init_db
 
 __all__ = [
-    "engine",
-    "async_session_factory",
+    "get_engine",
+    "get_session_factory",
     "get_db",
     "init_db",
+    "close_db",
 ]
@@ -0,0 +1,45 @@
+"""Opaque cursors for keyset pagination."""
+
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Mapping, Tuple
+
+
+def encode_cursor(sort_key: str, value: Any, id: uuid.UUID) -> str:
+    """
+    Encode the last row of a page as an opaque cursor.
+
+    sort_key identifies the ordering the cursor was issued for, so a cursor
+    cannot be replayed against a different sort.
+    """
+    if isinstance(value, datetime):
+        value = {"dt": value.isoformat()}
+    payload = json.dumps([sort_key, value, str(id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, value_types: Mapping[str, type]) -> Tuple[str, Any, uuid.UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    value_types maps each sortable field to the type its cursor value must
+    have, so a tampered cursor is rejected here rather than by the database.
+    Returns (sort_key, sort_value, id); raises ValueError if malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_key, value, id = json.loads(base64.urlsafe_b64decode(padded))
+        if isinstance(value, dict):
+            value = datetime.fromisoformat(value["dt"])
+        value_type = value_types[sort_key.split(":")[0]]
+        # bool is an int subclass but never a valid sort value
+        if not isinstance(value, value_type) or isinstance(value, bool):
+            raise ValueError("Cursor value does not match its sort key")
+        if not isinstance(id, str):
+            raise ValueError("Cursor id must be a string")
+        return sort_key, value, uuid.UUID(id)
+    except (ValueError, TypeError, KeyError, AttributeError, binascii.Error) as e:
+        raise ValueError("Invalid cursor") from e
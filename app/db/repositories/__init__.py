@@ -1,11 +1,13 @@
 """Repository layer for database operations."""
 
 from app.db.repositories.base import BaseRepository
+from app.db.repositories.call_repo import CallRepository
 from app.db.repositories.investor_repo import InvestorRepository
 from app.db.repositories.property_repo import PropertyRepository
 
 __all__ = [
     "BaseRepository",
+    "CallRepository",
     "InvestorRepository",
     "PropertyRepository",
 ]
@@ -1,11 +1,24 @@
 """Generic CRUD repository base class."""
 
 import uuid
-from typing import Generic, Optional, Sequence, Type, TypeVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import Select, delete, func, inspect, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
+from app.cache import row_estimate_cache
 from app.models.base import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
@@ -15,8 +28,12 @@ class BaseRepository(Generic[ModelType]):
     """
     Generic repository with basic CRUD operations.
     Inherit from this class to create model-specific repositories.
+    Repositories are created per request, so they carry __slots__ rather
+    than an instance __dict__.
     """
 
+    __slots__ = ("model", "session")
+
     def __init__(self, model: Type[ModelType], session: AsyncSession):
         self.model = model
         self.session = session
@@ -28,6 +45,23 @@ class BaseRepository(Generic[ModelType]):
         )
         return result.scalar_one_or_none()
 
+    async def get_fast(self, id: uuid.UUID) -> Optional[Dict[str, Any]]:
+        """
+        Get a single record by ID as a plain dict of column values.
+
+        Runs straight on the asyncpg connection, skipping statement
+        compilation and ORM object construction; asyncpg keeps the prepared
+        statement in its per-connection cache. Does not see unflushed
+        session changes. For hot read paths that only need columns.
+        """
+        conn = await self.session.connection()
+        raw = await conn.get_raw_connection()
+        driver: Any = raw.driver_connection  # asyncpg.Connection
+        record = await driver.fetchrow(
+            f"SELECT * FROM {self.model.__tablename__} WHERE id = $1", id
+        )
+        return dict(record) if record else None
+
     async def get_all(
         self, skip: int = 0, limit: int = 100
     ) -> Sequence[ModelType]:
@@ -37,17 +71,108 @@ class BaseRepository(Generic[ModelType]):
         )
         return result.scalars().all()
 
+    async def iter_all(
+        self, batch_size: int = 1000, **filters: Any
+    ) -> AsyncIterator[ModelType]:
+        """
+        Stream all records matching column equality filters, in id order.
+
+        Rows come from a server-side cursor batch_size at a time and each
+        batch is expunged from the session once consumed, so memory stays
+        flat regardless of result size. Relationships are not loaded.
+        """
+        stmt = (
+            select(self.model)
+            .filter_by(**filters)
+            .order_by(*inspect(self.model).primary_key)
+            .options(raiseload("*"))
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(stmt)
+        async for partition in result.scalars().partitions():
+            for obj in partition:
+                yield obj
+            for obj in partition:
+                self.session.expunge(obj)
+
     async def create(self, obj: ModelType) -> ModelType:
-        """Create a new record."""
+        """
+        Create a new record.
+        Server defaults come back via RETURNING on the INSERT (eager_defaults).
+        """
         self.session.add(obj)
         await self.session.flush()
-        await self.session.refresh(obj)
         return obj
 
+    async def copy_records(
+        self,
+        columns: Sequence[str],
+        records: Sequence[Tuple[Any, ...]],
+        model: Optional[Type[Base]] = None,
+    ) -> int:
+        """
+        Bulk-load rows into model's table (default: this repository's model)
+        with asyncpg's binary COPY ... FROM STDIN.
+
+        records are tuples in columns order; omitted columns take their
+        server defaults. No SQL text per row and nothing is returned, so
+        this is the fastest ingest path for thousands of rows. Bypasses the
+        ORM: the rows are not added to the session.
+        Returns the number of rows copied.
+        """
+        if not records:
+            return 0
+
+        # COPY runs on the session's connection, so pending ORM rows
+        # (e.g. parent records) must be written first
+        await self.session.flush()
+        conn = await self.session.connection()
+        raw = await conn.get_raw_connection()
+        driver: Any = raw.driver_connection  # asyncpg.Connection
+        await driver.copy_records_to_table(
+            (model or self.model).__tablename__,
+            records=records,
+            columns=list(columns),
+        )
+        return len(records)
+
+    async def create_many(
+        self,
+        objs: Sequence[ModelType],
+        batch_size: int = 1000,
+        ignore_conflicts: bool = False,
+    ) -> Sequence[ModelType]:
+        """
+        Create many records with batched INSERT ... RETURNING.
+
+        Each chunk of batch_size objects is sent as one multi-row INSERT
+        instead of a flush + refresh per object. Unset attributes are left
+        out so column defaults apply. With ignore_conflicts, rows that hit a
+        unique constraint are skipped (ON CONFLICT DO NOTHING) and are not
+        part of the returned list.
+        """
+        keys = [attr.key for attr in inspect(self.model).column_attrs]
+        stmt = pg_insert(self.model)
+        if ignore_conflicts:
+            stmt = stmt.on_conflict_do_nothing()
+        returning = stmt.returning(self.model)
+
+        created: list[ModelType] = []
+        for start in range(0, len(objs), batch_size):
+            rows = [
+                {key: value for key in keys if (value := getattr(obj, key)) is not None}
+                for obj in objs[start:start + batch_size]
+            ]
+            result = await self.session.execute(returning, rows)
+            created.extend(result.scalars().all())
+        return created
+
     async def update(self, obj: ModelType) -> ModelType:
-        """Update an existing record."""
+        """
+        Update an existing record.
+        updated_at comes back via RETURNING on the UPDATE (eager_defaults).
+        """
         await self.session.flush()
-        await self.session.refresh(obj)
         return obj
 
     async def delete(self, id: uuid.UUID) -> bool:
@@ -63,3 +188,49 @@ class BaseRepository(Generic[ModelType]):
             select(func.count()).select_from(self.model)
         )
         return result.scalar_one()
+
+    async def estimated_count(self) -> int:
+        """
+        Planner's row estimate for the table (pg_class.reltuples), kept
+        current by autovacuum/ANALYZE. O(1) regardless of table size, and
+        cached for row_estimate_ttl seconds so list pages do not pay an
+        extra round-trip for it.
+        Returns -1 if the table has never been analyzed.
+        """
+        table = self.model.__tablename__
+        cached = row_estimate_cache.get(table)
+        if cached is not None:
+            return int(cached)
+
+        result = await self.session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+            {"table": table},
+        )
+        estimate: int = result.scalar_one()
+        row_estimate_cache.set(table, estimate)
+        return estimate
+
+    async def _count_rows(self, query: Select[Any]) -> int:
+        """Count the rows an unpaginated query would return."""
+        result = await self.session.execute(
+            select(func.count()).select_from(query.subquery())
+        )
+        return result.scalar_one()
+
+    async def _fetch_with_total(
+        self, query: Select[Any], count_query: Select[Any]
+    ) -> Tuple[Sequence[ModelType], int]:
+        """
+        Fetch a page and the total match count in one round-trip.
+
+        The count comes from count(*) OVER (), which is evaluated before
+        LIMIT/OFFSET. An empty page carries no count, so in that case fall
+        back to counting count_query (the same query without pagination).
+        """
+        result = await self.session.execute(
+            query.add_columns(func.count().over().label("total_count"))
+        )
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total_count
+        return [], await self._count_rows(count_query)
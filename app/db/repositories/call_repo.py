@@ -0,0 +1,59 @@
+"""Voice call and transcript repository."""
+
+import uuid
+from typing import Any, Dict, Sequence, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repositories.base import BaseRepository
+from app.models.voice import CallSession, CallTranscript
+
+# Column order for copy_transcripts records (id and created_at use server defaults)
+TRANSCRIPT_COPY_COLUMNS = [
+    "call_session_id",
+    "speaker",
+    "content",
+    "start_time",
+    "end_time",
+    "confidence",
+]
+
+
+class CallRepository(BaseRepository[CallSession]):
+    """Repository for voice call operations."""
+
+    __slots__ = ()
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(CallSession, session)
+
+    async def add_transcripts(self, rows: Sequence[Dict[str, Any]]) -> int:
+        """
+        Insert transcript segments with one batched ORM bulk INSERT.
+
+        rows are dicts of CallTranscript column values. id and created_at are
+        filled client-side, so nothing is returned and the rows go out as a
+        single executemany. For very large loads use copy_transcripts.
+        Returns the number of rows inserted.
+        """
+        if not rows:
+            return 0
+        await self.session.execute(insert(CallTranscript), list(rows))
+        return len(rows)
+
+    async def copy_transcripts(
+        self, rows: Sequence[Tuple[uuid.UUID, str, str, Any, Any, Any]]
+    ) -> int:
+        """
+        Bulk-load transcript segments with COPY ... FROM STDIN.
+
+        rows are (call_session_id, speaker, content, start_time, end_time,
+        confidence) tuples. id (UUIDv7) and created_at come from their
+        server defaults, so nothing has to be returned. This bypasses the
+        ORM: the rows are not added to the session.
+        Returns the number of rows copied.
+        """
+        return await self.copy_records(
+            TRANSCRIPT_COPY_COLUMNS, list(rows), model=CallTranscript
+        )
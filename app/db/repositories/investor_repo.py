@@ -2,38 +2,166 @@
 
 import uuid
 from datetime import datetime
-from typing import Dict, Optional, Sequence, Tuple
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    String,
+    Text,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.db.repositories.base import BaseRepository
 from app.models.consent import Consent, LeadNote, StageHistory
 from app.models.investor import InvestorProfile
+from app.models.matching import DealMatch
+from app.models.pipeline import PipelineCounter
+from app.models.voice import CallSession
+
+# Above this many leads an unfiltered list reports the planner estimate as
+# its total instead of counting every row
+ESTIMATED_COUNT_THRESHOLD = 100_000
+
+SortBy = Literal["created_at", "lead_score", "capital_available"]
+SortOrder = Literal["asc", "desc"]
+
+# Sortable columns for search_leads. Leads without a capital figure sort as 0
+# so keyset comparisons never have to deal with NULLs.
+SORT_COLUMNS: Dict[SortBy, Any] = {
+    "created_at": InvestorProfile.created_at,
+    "lead_score": InvestorProfile.lead_score,
+    "capital_available": func.coalesce(InvestorProfile.capital_available, 0),
+}
+
+# Python type of each sort column's value, as carried in cursors
+SORT_VALUE_TYPES: Dict[str, type] = {
+    "created_at": datetime,
+    "lead_score": int,
+    "capital_available": int,
+}
+
+
+def _utc_iso(column: str) -> str:
+    """SQL rendering a timestamptz the way the API serializes datetimes (UTC, Z suffix)."""
+    return f"""to_char({column} AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"')"""
+
+
+# Lead detail view in one round-trip: Postgres builds the whole
+# LeadWithDetailsResponse document, related lists included, so the API can
+# return it as-is. Keys the frontend contract marks optional (`key?:`) are
+# left out when NULL, as with exclude_none; required keys stay, as null where
+# the contract allows it (e.g. fromStage).
+LEAD_JSON_SQL = text(
+    f"""
+    SELECT (jsonb_build_object(
+        'id', i.id,
+        'name', i.name,
+        'phone', i.phone,
+        'timeline', i.timeline,
+        'capitalAvailable', i.capital_available,
+        'investmentPreferences', COALESCE(i.investment_preferences, '{{}}'),
+        'stage', i.stage,
+        'leadScore', i.lead_score,
+        'source', i.source,
+        'createdAt', {_utc_iso('i.created_at')},
+        'updatedAt', {_utc_iso('i.updated_at')},
+        'calls', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'id', c.id,
+                'status', c.status,
+                'initiatedAt', {_utc_iso('c.initiated_at')}
+            ) || jsonb_strip_nulls(jsonb_build_object(
+                'duration', c.duration,
+                'transcript', c.transcript,
+                'recordingUrl', c.recording_url,
+                'completedAt', {_utc_iso('c.completed_at')}
+            )))
+            FROM call_sessions c
+            WHERE c.investor_id = i.id
+        ), '[]'),
+        'matches', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'id', m.id,
+                'dealMemoId', m.property_id,
+                'dealName', COALESCE(p.name, ''),
+                'similarityScore', m.similarity_score,
+                'matchReasons', COALESCE(m.match_reasons, '{{}}'),
+                'status', m.status,
+                'createdAt', {_utc_iso('m.created_at')}
+            ))
+            FROM deal_matches m
+            LEFT JOIN properties p ON p.id = m.property_id
+            WHERE m.investor_id = i.id
+        ), '[]'),
+        'notes', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'id', n.id,
+                'content', n.content,
+                'createdBy', n.created_by,
+                'createdAt', {_utc_iso('n.created_at')}
+            ) ORDER BY n.created_at DESC)
+            FROM lead_notes n
+            WHERE n.investor_id = i.id
+        ), '[]'),
+        'stageHistory', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'id', h.id,
+                'fromStage', h.from_stage,
+                'toStage', h.to_stage,
+                'changedBy', h.changed_by,
+                'changedAt', {_utc_iso('h.changed_at')}
+            ) || jsonb_strip_nulls(jsonb_build_object(
+                'notes', h.notes
+            )) ORDER BY h.changed_at DESC)
+            FROM stage_history h
+            WHERE h.investor_id = i.id
+        ), '[]')
+    ) || jsonb_strip_nulls(jsonb_build_object(
+        'investmentThesis', i.investment_thesis,
+        'riskTolerance', i.risk_tolerance,
+        'qualification', CASE
+            WHEN NULLIF(i.investor_type, '') IS NOT NULL
+                AND i.qualification_bucket IS NOT NULL
+            THEN jsonb_build_object(
+                'investorType', i.investor_type,
+                'capacity', COALESCE(i.capacity, ''),
+                'fit', COALESCE(i.fit, ''),
+                'process', COALESCE(i.process, ''),
+                'timing', COALESCE(i.timing, ''),
+                'score', COALESCE(NULLIF(i.qualification_score, 0), i.lead_score),
+                'bucket', i.qualification_bucket
+            )
+        END
+    )))::text
+    FROM investor_profiles i
+    WHERE i.id = :id
+    """
+)
 
 
 class InvestorRepository(BaseRepository[InvestorProfile]):
     """Repository for investor/lead operations."""
 
+    __slots__ = ()
+
     def __init__(self, session: AsyncSession):
         super().__init__(InvestorProfile, session)
 
-    async def get_with_relations(
-        self, id: uuid.UUID
-    ) -> Optional[InvestorProfile]:
-        """Get investor with all related data (calls, matches, notes, stage_history)."""
-        result = await self.session.execute(
-            select(InvestorProfile)
-            .options(
-                selectinload(InvestorProfile.calls),
-                selectinload(InvestorProfile.matches),
-                selectinload(InvestorProfile.notes),
-                selectinload(InvestorProfile.stage_history),
-                selectinload(InvestorProfile.consents),
-            )
-            .where(InvestorProfile.id == id)
-        )
+    async def get_lead_json(self, id: uuid.UUID) -> Optional[str]:
+        """
+        Get the lead detail document (LeadWithDetailsResponse shape) as JSON
+        text assembled by Postgres, without building ORM or Pydantic objects.
+        """
+        result = await self.session.execute(LEAD_JSON_SQL, {"id": id})
         return result.scalar_one_or_none()
 
     async def get_by_phone(self, phone: str) -> Optional[InvestorProfile]:
@@ -43,27 +171,127 @@ class InvestorRepository(BaseRepository[InvestorProfile]):
         )
         return result.scalar_one_or_none()
 
-    async def get_by_stage(self, stage: str) -> Sequence[InvestorProfile]:
-        """Get all investors in a specific pipeline stage."""
+    async def create_with_consent(
+        self,
+        values: Dict[str, Any],
+        consent_text: str,
+        ip_address: Optional[str],
+        user_agent: Optional[str],
+        notes: str,
+    ) -> Tuple[uuid.UUID, bool]:
+        """
+        Insert an investor with its consent and initial stage_history rows in
+        a single statement, unless one with the same phone exists.
+        Returns (investor_id, created); the unique phone index makes this safe
+        against concurrent submissions for the same number.
+        """
+        # The investor INSERT is a CTE; consent and stage history are
+        # inserted from its RETURNING, so when the phone conflicts no row
+        # comes back and nothing else is written. The child rows take their
+        # ids from uuid_generate_v7(): SQLAlchemy can't prefetch the Python
+        # uuid7 default for an INSERT ... SELECT nested in a CTE.
+        ins = (
+            pg_insert(InvestorProfile)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[InvestorProfile.phone])
+            .returning(InvestorProfile.id)
+            .cte("ins")
+        )
+        consent = (
+            insert(Consent)
+            .from_select(
+                ["id", "investor_id", "consent_text", "ip_address", "user_agent"],
+                select(
+                    func.uuid_generate_v7(),
+                    ins.c.id,
+                    literal(consent_text, Text),
+                    literal(ip_address, String),
+                    literal(user_agent, Text),
+                ),
+            )
+            .cte("consent")
+        )
+        result = await self.session.execute(
+            insert(StageHistory)
+            .add_cte(consent)
+            .from_select(
+                ["id", "investor_id", "to_stage", "changed_by", "notes"],
+                select(
+                    func.uuid_generate_v7(),
+                    ins.c.id,
+                    literal(values["stage"], String),
+                    literal("system", String),
+                    literal(notes, Text),
+                ),
+            )
+            .returning(StageHistory.investor_id)
+        )
+        investor_id = result.scalar_one_or_none()
+        if investor_id is not None:
+            return investor_id, True
+
         result = await self.session.execute(
+            select(InvestorProfile.id).where(InvestorProfile.phone == values["phone"])
+        )
+        return result.scalar_one(), False
+
+    async def get_by_preferences(
+        self, preferences: Sequence[str], limit: int = 100
+    ) -> Sequence[InvestorProfile]:
+        """
+        Get investors whose investment_preferences share any value with
+        preferences (array overlap, served by the GIN index), best leads first.
+        """
+        result = await self.session.execute(
+            select(InvestorProfile)
+            .where(InvestorProfile.investment_preferences.overlap(list(preferences)))
+            .order_by(InvestorProfile.lead_score.desc())
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+    async def get_by_stage(
+        self, stage: str, load_relations: bool = False
+    ) -> Sequence[InvestorProfile]:
+        """
+        Get all investors in a specific pipeline stage.
+        With load_relations, notes, stage_history and matches are loaded in
+        one SELECT ... IN per relation rather than per investor.
+        """
+        query = (
             select(InvestorProfile)
             .where(InvestorProfile.stage == stage)
             .order_by(InvestorProfile.lead_score.desc())
         )
+        if load_relations:
+            query = query.options(
+                selectinload(InvestorProfile.notes),
+                selectinload(InvestorProfile.stage_history),
+                selectinload(InvestorProfile.matches),
+                raiseload("*"),
+            )
+        result = await self.session.execute(query)
         return result.scalars().all()
 
     async def get_stats_by_stage(self) -> Dict[str, int]:
         """Get count of investors per pipeline stage."""
+        # Read the trigger-maintained counters (one row per stage) instead of
+        # aggregating investor_profiles; Postgres builds the {stage: count}
+        # object itself so a single row comes back
         result = await self.session.execute(
-            select(InvestorProfile.stage, func.count(InvestorProfile.id))
-            .group_by(InvestorProfile.stage)
+            select(
+                func.jsonb_object_agg(PipelineCounter.stage, PipelineCounter.n, type_=JSONB)
+            ).where(PipelineCounter.n > 0)
         )
-        return dict(result.all())
+        return dict(result.scalar_one() or {})
 
     async def get_average_score(self) -> float:
-        """Get average lead score."""
+        """Get average lead score from the pipeline counters."""
         result = await self.session.execute(
-            select(func.avg(InvestorProfile.lead_score))
+            select(
+                func.sum(PipelineCounter.lead_score_sum)
+                / func.nullif(func.sum(PipelineCounter.n), 0)
+            )
         )
         avg = result.scalar_one_or_none()
         return float(avg) if avg else 0.0
@@ -78,14 +306,24 @@ class InvestorRepository(BaseRepository[InvestorProfile]):
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
         search: Optional[str] = None,
-        sort_by: str = "created_at",
-        sort_order: str = "desc",
+        sort_by: SortBy = "created_at",
+        sort_order: SortOrder = "desc",
         skip: int = 0,
         limit: int = 20,
-    ) -> Tuple[Sequence[InvestorProfile], int]:
+        after: Optional[Tuple[Any, uuid.UUID]] = None,
+        include_total: bool = True,
+    ) -> Tuple[Sequence[InvestorProfile], Optional[int]]:
         """
         Search leads with filters, pagination, and sorting.
-        Returns (leads, total_count).
+        Returns (leads, total_count); total_count is None unless include_total
+        and always None for keyset pages (`after`), and is the planner
+        estimate for unfiltered lists once the table has
+        ESTIMATED_COUNT_THRESHOLD rows.
+
+        Pagination is keyset-based when `after` is given: pass the
+        (sort_value, id) of the last lead on the previous page (see
+        cursor_for) and `skip` is ignored. Offset pagination is kept for
+        page-number callers.
 
         Matches frontend LeadFilters interface:
         - stage: PipelineStage filter
@@ -98,6 +336,7 @@ class InvestorRepository(BaseRepository[InvestorProfile]):
         """
         # Base query
         query = select(InvestorProfile)
+        unfiltered = query
 
         # Apply filters
         if stage:
@@ -117,32 +356,86 @@ class InvestorRepository(BaseRepository[InvestorProfile]):
         if search:
             query = query.where(InvestorProfile.phone.contains(search))
 
-        # Count total before pagination
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar_one()
+        filtered = query
 
-        # Sorting
-        sort_column_map = {
-            "created_at": InvestorProfile.created_at,
-            "lead_score": InvestorProfile.lead_score,
-            "capital_available": InvestorProfile.capital_available,
-        }
-        sort_column = sort_column_map.get(sort_by, InvestorProfile.created_at)
+        # Sorting, with id as tie-breaker so the order is total
+        sort_column = SORT_COLUMNS.get(sort_by, InvestorProfile.created_at)
+        keyset = tuple_(sort_column, InvestorProfile.id)
+        cursor = tuple_(literal(after[0]), literal(after[1])) if after else None
 
         if sort_order == "desc":
-            query = query.order_by(sort_column.desc())
+            query = query.order_by(sort_column.desc(), InvestorProfile.id.desc())
+            if after:
+                query = query.where(keyset < cursor)
         else:
-            query = query.order_by(sort_column.asc())
+            query = query.order_by(sort_column.asc(), InvestorProfile.id.asc())
+            if after:
+                query = query.where(keyset > cursor)
 
         # Pagination
-        query = query.offset(skip).limit(limit)
+        if not after:
+            query = query.offset(skip)
+        query = query.limit(limit)
+
+        # Execute. The total rides along on each row as a window count.
+        # Counting is O(matching rows), so callers that only need a page
+        # can skip it, and keyset pages never count: the cursor predicate
+        # would skew the window count, and a separate count per page is the
+        # very scan keyset paging avoids.
+        include_total = include_total and after is None
+        # Unfiltered lists of a large table report the planner estimate:
+        # an approximate total is fine for page math and costs nothing
+        estimate = None
+        if include_total and filtered is unfiltered:
+            estimate = await self.estimated_count()
+            if estimate < ESTIMATED_COUNT_THRESHOLD:
+                estimate = None
+
+        if include_total and estimate is None:
+            return await self._fetch_with_total(query, filtered)
 
-        # Execute
         result = await self.session.execute(query)
-        leads = result.scalars().all()
+        return result.scalars().all(), estimate
 
-        return leads, total
+    async def get_list_summaries(
+        self, ids: Sequence[uuid.UUID]
+    ) -> Dict[uuid.UUID, Tuple[Optional[str], int]]:
+        """
+        Get (last_call_status, match_count) for each listed lead in one flat
+        query: one row per lead, without loading the related rows.
+        """
+        if not ids:
+            return {}
+        last_call_status = (
+            select(CallSession.status)
+            .where(CallSession.investor_id == InvestorProfile.id)
+            .order_by(CallSession.initiated_at.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            select(
+                InvestorProfile.id,
+                last_call_status,
+                func.count(DealMatch.id),
+            )
+            .outerjoin(DealMatch, DealMatch.investor_id == InvestorProfile.id)
+            .where(InvestorProfile.id.in_(ids))
+            .group_by(InvestorProfile.id)
+        )
+        return {
+            investor_id: (status, match_count)
+            for investor_id, status, match_count in result.all()
+        }
+
+    @staticmethod
+    def cursor_for(lead: InvestorProfile, sort_by: SortBy) -> Tuple[Any, uuid.UUID]:
+        """Keyset position of a lead under the given sort, for `after`."""
+        if sort_by == "lead_score":
+            return lead.lead_score, lead.id
+        if sort_by == "capital_available":
+            return lead.capital_available or 0, lead.id
+        return lead.created_at, lead.id
 
     async def update_stage(
         self,
@@ -150,32 +443,47 @@ class InvestorRepository(BaseRepository[InvestorProfile]):
         new_stage: str,
         changed_by: str = "admin",
         notes: Optional[str] = None,
-    ) -> Optional[InvestorProfile]:
+    ) -> bool:
         """
-        Update investor stage and record history.
-        Returns the updated investor or None if not found.
+        Update investor stage and record history in a single statement.
+        Returns False if the investor does not exist.
         """
-        investor = await self.get(investor_id)
-        if not investor:
-            return None
-
-        old_stage = investor.stage
-        investor.stage = new_stage
-
-        # Record stage change history
-        stage_change = StageHistory(
-            investor_id=investor_id,
-            from_stage=old_stage,
-            to_stage=new_stage,
-            changed_by=changed_by,
-            notes=notes,
+        # UPDATE ... RETURNING only sees the new row, so the old stage comes
+        # from a locked self-join; the history row is inserted from the
+        # updated row in the same statement. Its id comes from
+        # uuid_generate_v7(), since the Python uuid7 default isn't applied to
+        # INSERT ... SELECT.
+        old = (
+            select(InvestorProfile.id, InvestorProfile.stage)
+            .where(InvestorProfile.id == investor_id)
+            .with_for_update()
+            .subquery("old")
         )
-        self.session.add(stage_change)
-
-        await self.session.flush()
-        await self.session.refresh(investor)
-
-        return investor
+        upd = (
+            update(InvestorProfile)
+            .where(InvestorProfile.id == old.c.id)
+            .values(stage=new_stage)
+            .returning(InvestorProfile.id, old.c.stage.label("old_stage"))
+            .cte("upd")
+        )
+        result = await self.session.execute(
+            insert(StageHistory)
+            .from_select(
+                ["id", "investor_id", "from_stage", "to_stage", "changed_by", "notes"],
+                select(
+                    func.uuid_generate_v7(),
+                    upd.c.id,
+                    upd.c.old_stage,
+                    literal(new_stage, String),
+                    literal(changed_by, String),
+                    literal(notes, Text),
+                ),
+            )
+            .returning(StageHistory.id)
+        )
+        if result.scalar_one_or_none() is None:
+            return False
+        return True
 
     async def add_note(
         self,
@@ -183,21 +491,23 @@ class InvestorRepository(BaseRepository[InvestorProfile]):
         content: str,
         created_by: str = "admin",
     ) -> Optional[LeadNote]:
-        """Add a note to an investor."""
-        investor = await self.get(investor_id)
-        if not investor:
-            return None
-
-        note = LeadNote(
-            investor_id=investor_id,
-            content=content,
-            created_by=created_by,
+        """
+        Add a note to an investor.
+        Returns None if the investor does not exist (nothing is inserted).
+        """
+        result = await self.session.execute(
+            insert(LeadNote)
+            .from_select(
+                ["investor_id", "content", "created_by"],
+                select(
+                    InvestorProfile.id,
+                    literal(content, Text),
+                    literal(created_by, String),
+                ).where(InvestorProfile.id == investor_id),
+            )
+            .returning(LeadNote)
         )
-        self.session.add(note)
-        await self.session.flush()
-        await self.session.refresh(note)
-
-        return note
+        return result.scalar_one_or_none()
 
     async def add_consent(
         self,
@@ -206,15 +516,38 @@ class InvestorRepository(BaseRepository[InvestorProfile]):
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
     ) -> Consent:
-        """Add a consent record for an investor."""
-        consent = Consent(
-            investor_id=investor_id,
-            consent_text=consent_text,
-            ip_address=ip_address,
-            user_agent=user_agent,
-        )
-        self.session.add(consent)
-        await self.session.flush()
-        await self.session.refresh(consent)
-
-        return consent
+        """
+        Add a consent record for an investor.
+        Repeats of the same consent (e.g. a retried submit) return the
+        existing record instead of inserting a duplicate.
+        """
+        dedup_key: List[Any] = [
+            Consent.investor_id,
+            func.md5(Consent.consent_text),
+            func.coalesce(Consent.ip_address, ""),
+            func.coalesce(Consent.user_agent, ""),
+        ]
+        result = await self.session.execute(
+            pg_insert(Consent)
+            .values(
+                investor_id=investor_id,
+                consent_text=consent_text,
+                ip_address=ip_address,
+                user_agent=user_agent,
+            )
+            .on_conflict_do_nothing(index_elements=dedup_key)
+            .returning(Consent)
+        )
+        consent = result.scalar_one_or_none()
+        if consent is not None:
+            return consent
+
+        result = await self.session.execute(
+            select(Consent).where(
+                Consent.investor_id == investor_id,
+                Consent.consent_text == consent_text,
+                func.coalesce(Consent.ip_address, "") == (ip_address or ""),
+                func.coalesce(Consent.user_agent, "") == (user_agent or ""),
+            )
+        )
+        return result.scalar_one()
@@ -1,9 +1,10 @@
 """Property/Deal repository."""
 
 import uuid
-from typing import Optional, Sequence, Tuple
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence, Tuple
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, literal, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -14,6 +15,8 @@ from app.models.property import Property, PropertyFeature
 class PropertyRepository(BaseRepository[Property]):
     """Repository for property/deal operations."""
 
+    __slots__ = ()
+
     def __init__(self, session: AsyncSession):
         super().__init__(Property, session)
 
@@ -27,41 +30,44 @@ class PropertyRepository(BaseRepository[Property]):
         return result.scalar_one_or_none()
 
     async def get_by_status(
-        self, status: str, skip: int = 0, limit: int = 100
+        self,
+        status: str,
+        skip: int = 0,
+        limit: int = 100,
+        load_features: bool = False,
     ) -> Sequence[Property]:
-        """Get all properties with a specific status."""
-        result = await self.session.execute(
+        """
+        Get all properties with a specific status.
+        With load_features, features are loaded in a single SELECT ... IN.
+        """
+        query = (
             select(Property)
             .where(Property.status == status)
             .order_by(Property.created_at.desc())
             .offset(skip)
             .limit(limit)
         )
+        if load_features:
+            query = query.options(selectinload(Property.features))
+        result = await self.session.execute(query)
         return result.scalars().all()
 
     async def get_active_deals(
-        self, skip: int = 0, limit: int = 100
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
     ) -> Tuple[Sequence[Property], int]:
-        """Get all active deals with total count."""
-        # Count total active
-        count_result = await self.session.execute(
-            select(func.count())
-            .select_from(Property)
-            .where(Property.status == "active")
-        )
-        total = count_result.scalar_one()
-
-        # Get deals
-        result = await self.session.execute(
-            select(Property)
-            .where(Property.status == "active")
-            .order_by(Property.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-        )
-        deals = result.scalars().all()
+        """
+        Get all active deals with total count.
+        Pass the (created_at, id) of the previous page's last deal as `after`
+        for keyset pagination; `skip` is then ignored.
+        """
+        filtered = select(Property).where(Property.status == "active")
+        query = filtered.order_by(Property.created_at.desc(), Property.id.desc())
+        query = self._paginate(query, skip, limit, after)
 
-        return deals, total
+        return await self._fetch_page(query, filtered, after)
 
     async def search_deals(
         self,
@@ -71,10 +77,12 @@ class PropertyRepository(BaseRepository[Property]):
         search: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
     ) -> Tuple[Sequence[Property], int]:
         """
         Search deals with filters.
         Returns (deals, total_count).
+        Supports keyset pagination via `after`, as in get_active_deals.
         """
         query = select(Property)
 
@@ -90,18 +98,34 @@ class PropertyRepository(BaseRepository[Property]):
                 | Property.summary.ilike(f"%{search}%")
             )
 
-        # Count total
-        count_query = select(func.count()).select_from(query.subquery())
-        count_result = await self.session.execute(count_query)
-        total = count_result.scalar_one()
-
         # Order and paginate
-        query = query.order_by(Property.created_at.desc()).offset(skip).limit(limit)
+        filtered = query
+        query = query.order_by(Property.created_at.desc(), Property.id.desc())
+        query = self._paginate(query, skip, limit, after)
 
-        result = await self.session.execute(query)
-        deals = result.scalars().all()
+        return await self._fetch_page(query, filtered, after)
+
+    async def search_by_features(
+        self,
+        features: Dict[str, Any],
+        asset_type: Optional[str] = None,
+    ) -> Sequence[Property]:
+        """
+        Get properties whose features include all the given key/values.
 
-        return deals, total
+        Uses JSONB containment (@>), which the jsonb_path_ops GIN index on
+        property_features.features can serve; ->>/-> comparisons cannot.
+        """
+        query = (
+            select(Property)
+            .join(Property.features)
+            .where(PropertyFeature.features.contains(features))
+        )
+        if asset_type:
+            query = query.where(PropertyFeature.asset_type == asset_type)
+
+        result = await self.session.execute(query)
+        return result.scalars().all()
 
     async def create_with_features(
         self,
@@ -128,12 +152,39 @@ class PropertyRepository(BaseRepository[Property]):
         self, id: uuid.UUID, status: str
     ) -> Optional[Property]:
         """Update property status."""
-        property_obj = await self.get(id)
-        if not property_obj:
-            return None
+        result = await self.session.execute(
+            update(Property)
+            .where(Property.id == id)
+            .values(status=status)
+            .returning(Property)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
 
-        property_obj.status = status
-        await self.session.flush()
-        await self.session.refresh(property_obj)
+    @staticmethod
+    def _paginate(
+        query: Select[Any],
+        skip: int,
+        limit: int,
+        after: Optional[Tuple[datetime, uuid.UUID]],
+    ) -> Select[Any]:
+        """Apply keyset (when `after` is set) or offset pagination."""
+        if after:
+            cursor = tuple_(literal(after[0]), literal(after[1]))
+            query = query.where(tuple_(Property.created_at, Property.id) < cursor)
+        else:
+            query = query.offset(skip)
+        return query.limit(limit)
+
+    async def _fetch_page(
+        self,
+        query: Select[Any],
+        filtered: Select[Any],
+        after: Optional[Tuple[datetime, uuid.UUID]],
+    ) -> Tuple[Sequence[Property], int]:
+        """Fetch a page with its total; a keyset page is counted separately."""
+        if not after:
+            return await self._fetch_with_total(query, filtered)
 
-        return property_obj
+        result = await self.session.execute(query)
+        return result.scalars().all(), await self._count_rows(filtered)
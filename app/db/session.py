@@ -1,40 +1,99 @@
 """Database session configuration for async SQLAlchemy."""
 
-from typing import AsyncGenerator
+import asyncio
+import uuid
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
 
 from app.config import get_settings
 
-settings = get_settings()
 
-# Create async engine
-engine = create_async_engine(
-    settings.async_database_url,
-    pool_size=20,
-    max_overflow=10,
-    pool_pre_ping=True,
-    echo=settings.debug,
-)
+def _unique_statement_name() -> str:
+    """Prepared statement name that cannot clash across PgBouncer clients."""
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """
+    Get the process-wide async engine, created on first use.
+    To rebuild it (e.g. after changing settings in tests), dispose the old
+    engine and clear both get_engine and get_session_factory caches.
+    """
+    settings = get_settings()
+
+    engine_options: Dict[str, Any]
+    if settings.db_pgbouncer:
+        # PgBouncer in transaction mode does the pooling and hands each
+        # transaction a different server connection: no second pool layer here,
+        # and no prepared-statement caches (asyncpg's own and SQLAlchemy's
+        # adapter cache) since cached statements would point at the wrong
+        # backend. JIT is off because its compile cost dominates short OLTP
+        # queries on freshly multiplexed backends.
+        engine_options = {
+            "poolclass": NullPool,
+            "connect_args": {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                # SQLAlchemy still prepares each statement (asyncpg has no
+                # unprepared path for bind parameters); unique names keep two
+                # clients sharing a server connection from colliding
+                "prepared_statement_name_func": _unique_statement_name,
+                "server_settings": {"jit": "off"},
+            },
+        }
+    else:
+        # Direct Postgres: keep a local pool and cache prepared statements for
+        # the hot lookups per connection
+        engine_options = {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+            "pool_recycle": settings.db_pool_recycle,
+            "pool_pre_ping": True,
+            "connect_args": {
+                "statement_cache_size": settings.db_statement_cache_size,
+                "prepared_statement_cache_size": settings.db_statement_cache_size,
+            },
+        }
+
+    return create_async_engine(
+        settings.async_database_url,
+        echo=settings.debug,
+        **engine_options,
+    )
 
-# Session factory
-async_session_factory = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autoflush=False,
-)
+
+@lru_cache(maxsize=1)
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get the session factory bound to get_engine()."""
+    return async_sessionmaker(
+        get_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+    )
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for FastAPI endpoints.
-    Provides an async database session with automatic commit/rollback.
+    Provides an async database session. Nothing is committed implicitly:
+    mutating handlers call session.commit() themselves, so read-only
+    requests skip the COMMIT round-trip. Rolls back on error.
     """
-    async with async_session_factory() as session:
+    async with get_session_factory()() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -44,10 +103,32 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 async def init_db() -> None:
     """
-    Initialize database connection.
+    Initialize database connection and warm the pool.
     Called during application startup.
+
+    Opens db_warmup_connections connections concurrently (capped at the
+    pool size) and pings each, so the first requests after a deploy don't
+    pay connection setup. Under PgBouncer there is no local pool to keep
+    them in, so only reachability is checked.
+    """
+    settings = get_settings()
+    engine = get_engine()
+    warmup = 1 if settings.db_pgbouncer else min(
+        max(settings.db_warmup_connections, 1), settings.db_pool_size
+    )
+
+    async def ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # All checkouts happen before any connection is returned, so each ping
+    # establishes its own connection
+    await asyncio.gather(*(ping() for _ in range(warmup)))
+
+
+async def close_db() -> None:
+    """
+    Dispose the engine's connection pool.
+    Called during application shutdown.
     """
-    # Test connection
-    async with engine.begin() as conn:
-        # Could run migrations here, but we use Alembic for that
-        pass
+    await get_engine().dispose()
@@ -1,11 +1,22 @@
 """FastAPI dependency injection for repositories and services."""
 
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.db.repositories.call_repo import CallRepository
 from app.db.repositories.investor_repo import InvestorRepository
 from app.db.repositories.property_repo import PropertyRepository
-from app.db.session import get_db
+from app.db.session import get_db, get_session_factory
+
+# Factories stay `async def` even though they never await: FastAPI calls
+# async dependencies inline on the event loop but dispatches plain `def`
+# dependencies to the threadpool (run_in_threadpool), which costs far more
+# than creating a coroutine.
+
+
+async def get_db_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get the session factory, for handlers that open their own sessions."""
+    return get_session_factory()
 
 
 async def get_investor_repo(
@@ -20,3 +31,10 @@ async def get_property_repo(
 ) -> PropertyRepository:
     """Get PropertyRepository instance."""
     return PropertyRepository(session)
+
+
+async def get_call_repo(
+    session: AsyncSession = Depends(get_db),
+) -> CallRepository:
+    """Get CallRepository instance."""
+    return CallRepository(session)
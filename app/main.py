@@ -3,9 +3,13 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from app.cache import close_redis
 from app.config import get_settings
-from app.db.session import init_db
+from app.db.session import close_db, init_db
+from app.routers import ROUTERS
+from app.s3 import close_s3_client, get_s3_client
 
 settings = get_settings()
 
@@ -15,8 +19,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler for startup/shutdown events."""
     # Startup
     await init_db()
+    await get_s3_client()
     yield
-    # Shutdown (cleanup if needed)
+    # Shutdown
+    await close_s3_client()
+    await close_redis()
+    await close_db()
 
 
 app = FastAPI(
@@ -24,6 +32,8 @@ app = FastAPI(
     description="Autonomous Capital Alignment System - Backend API",
     version="1.0.0",
     lifespan=lifespan,
+    # orjson encodes datetimes/UUIDs natively in C; much faster than stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -42,9 +52,5 @@ async def health_check() -> dict:
     return {"status": "healthy", "version": "1.0.0"}
 
 
-# Import and include routers
-from app.routers import admin, leads, properties  # noqa: E402
-
-app.include_router(leads.router, prefix="/api/v1", tags=["leads"])
-app.include_router(admin.router, prefix="/api/v1/admin", tags=["admin"])
-app.include_router(properties.router, prefix="/api/v1/properties", tags=["properties"])
+for router, prefix, tags in ROUTERS:
+    app.include_router(router, prefix=prefix, tags=tags)
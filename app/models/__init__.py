@@ -4,6 +4,7 @@ from app.models.base import Base, TimestampMixin, UUIDMixin
 from app.models.consent import Consent, LeadNote, StageHistory
 from app.models.investor import InvestorProfile
 from app.models.matching import DealMatch
+from app.models.pipeline import PipelineCounter
 from app.models.property import Property, PropertyDocument, PropertyFeature
 from app.models.voice import CallSession, CallTranscript
 
@@ -24,6 +25,8 @@ __all__ = [
     "StageHistory",
     # Matching
     "DealMatch",
+    # Pipeline
+    "PipelineCounter",
     # Voice
     "CallSession",
     "CallTranscript",
@@ -1,12 +1,33 @@
+import os
+import time
 import uuid
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits are the Unix timestamp in milliseconds, so new keys
+    append to the right edge of the primary key B-tree instead of landing
+    on random leaf pages like uuid4.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+
+    value = (unix_ts_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # version
+    value |= ((rand >> 62) & 0xFFF) << 64  # rand_a
+    value |= 0b10 << 62  # variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b
+    return uuid.UUID(int=value)
+
+
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
 
@@ -14,14 +35,25 @@ class Base(DeclarativeBase):
         dict[str, Any]: "JSONB",
     }
 
+    # Fetch server-generated values (created_at, updated_at, ...) with
+    # RETURNING on the INSERT/UPDATE itself instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
 
 class UUIDMixin:
-    """Mixin for UUID primary keys."""
+    """
+    Mixin for time-ordered (v7) UUID primary keys.
+
+    ORM inserts generate the key client-side, which keeps multi-row flushes
+    batched; raw SQL and COPY inserts fall back to uuid_generate_v7() in
+    Postgres (migration 003).
+    """
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
+        server_default=text("uuid_generate_v7()"),
     )
 
 
@@ -10,7 +10,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -63,6 +63,10 @@ class LeadNote(Base, UUIDMixin):
     """
 
     __tablename__ = "lead_notes"
+    __table_args__ = (
+        # Serves InvestorProfile.notes (newest first) without a sort
+        Index("idx_lead_notes_investor_created", "investor_id", text("created_at DESC")),
+    )
 
     investor_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -99,6 +103,10 @@ class StageHistory(Base, UUIDMixin):
     """
 
     __tablename__ = "stage_history"
+    __table_args__ = (
+        # Serves InvestorProfile.stage_history (newest first) without a sort
+        Index("idx_stage_history_investor_changed", "investor_id", text("changed_at DESC")),
+    )
 
     investor_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -23,9 +23,9 @@ interface LeadWithDetails {
 }
 """
 import uuid
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Literal, Optional, get_args
 
-from sqlalchemy import Integer, String, Text
+from sqlalchemy import Enum, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -37,6 +37,21 @@ if TYPE_CHECKING:
     from app.models.voice import CallSession
 
 
+# Closed value sets stored as native Postgres ENUMs (4 bytes per value)
+PipelineStage = Literal[
+    "new_lead",
+    "call_dispatched",
+    "call_completed",
+    "insights_extracted",
+    "deals_matched",
+    "under_review",
+    "closed",
+]
+PIPELINE_STAGES = get_args(PipelineStage)
+QualificationBucket = Literal["active_intro", "nurture", "not_qualified"]
+QUALIFICATION_BUCKETS = get_args(QualificationBucket)
+
+
 class InvestorProfile(Base, UUIDMixin, TimestampMixin):
     """
     Core investor/lead record.
@@ -44,6 +59,23 @@ class InvestorProfile(Base, UUIDMixin, TimestampMixin):
     """
 
     __tablename__ = "investor_profiles"
+    __table_args__ = (
+        # One lead per phone; submit_lead upserts against this
+        Index("idx_investor_profiles_phone_unique", "phone", unique=True),
+        # Stage-filtered lead lists in the default newest-first order
+        Index(
+            "idx_investor_profiles_stage_created_id",
+            "stage",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        # Array overlap/containment (&&, @>) for deal matching
+        Index(
+            "idx_investor_profiles_preferences_gin",
+            "investment_preferences",
+            postgresql_using="gin",
+        ),
+    )
 
     # Basic contact info
     phone: Mapped[str] = mapped_column(String(20), nullable=False)
@@ -61,7 +93,9 @@ class InvestorProfile(Base, UUIDMixin, TimestampMixin):
     # Pipeline tracking
     # PipelineStage: new_lead, call_dispatched, call_completed, insights_extracted,
     #                deals_matched, under_review, closed
-    stage: Mapped[str] = mapped_column(String(50), default="new_lead", nullable=False)
+    stage: Mapped[str] = mapped_column(
+        Enum(*PIPELINE_STAGES, name="pipeline_stage"), default="new_lead", nullable=False
+    )
     lead_score: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     source: Mapped[str] = mapped_column(String(50), default="web", nullable=False)
 
@@ -77,34 +111,36 @@ class InvestorProfile(Base, UUIDMixin, TimestampMixin):
     # timing: 'actively_deploying' | 'possibly_evaluating' | 'just_researching' | 'other:...'
     timing: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     # bucket: 'active_intro' | 'nurture' | 'not_qualified'
-    qualification_bucket: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    qualification_bucket: Mapped[Optional[str]] = mapped_column(
+        Enum(*QUALIFICATION_BUCKETS, name="qualification_bucket"), nullable=True
+    )
     qualification_score: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Relationships
     calls: Mapped[List["CallSession"]] = relationship(
         back_populates="investor",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     matches: Mapped[List["DealMatch"]] = relationship(
         back_populates="investor",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     notes: Mapped[List["LeadNote"]] = relationship(
         back_populates="investor",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
         order_by="LeadNote.created_at.desc()",
     )
     stage_history: Mapped[List["StageHistory"]] = relationship(
         back_populates="investor",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
         order_by="StageHistory.changed_at.desc()",
     )
     consents: Mapped[List["Consent"]] = relationship(
         back_populates="investor",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
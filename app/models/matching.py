@@ -16,7 +16,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Numeric, String, Text, func
+from sqlalchemy import DateTime, Double, Enum, ForeignKey, Index, String, Text, func, text
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -27,6 +27,9 @@ if TYPE_CHECKING:
     from app.models.property import Property
 
 
+MATCH_STATUSES = ("pending", "presented", "accepted", "rejected")
+
+
 class DealMatch(Base, UUIDMixin):
     """
     Match between an investor and a property/deal.
@@ -44,6 +47,15 @@ class DealMatch(Base, UUIDMixin):
     """
 
     __tablename__ = "deal_matches"
+    __table_args__ = (
+        Index("idx_deal_matches_investor_created", "investor_id", text("created_at DESC")),
+        # Matches still awaiting review; only a small slice of the table
+        Index(
+            "idx_deal_matches_pending",
+            "investor_id",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
 
     investor_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -58,15 +70,15 @@ class DealMatch(Base, UUIDMixin):
     )
 
     # Match scoring
-    similarity_score: Mapped[float] = mapped_column(
-        Numeric(5, 4), default=0.0, nullable=False
-    )
+    similarity_score: Mapped[float] = mapped_column(Double, default=0.0, nullable=False)
     match_reasons: Mapped[List[str]] = mapped_column(
         ARRAY(String), default=list, server_default="{}"
     )
 
     # Status: 'pending' | 'presented' | 'accepted' | 'rejected'
-    status: Mapped[str] = mapped_column(String(50), default="pending", nullable=False)
+    status: Mapped[str] = mapped_column(
+        Enum(*MATCH_STATUSES, name="match_status"), default="pending", nullable=False
+    )
 
     # Optional notes
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -79,7 +91,13 @@ class DealMatch(Base, UUIDMixin):
 
     # Relationships
     investor: Mapped["InvestorProfile"] = relationship(back_populates="matches")
-    matched_property: Mapped["Property"] = relationship(back_populates="matches")
+    # Loaded in the same query as the match (deal_name needs it); property_id
+    # is NOT NULL so an INNER JOIN is safe
+    matched_property: Mapped["Property"] = relationship(
+        back_populates="matches",
+        lazy="joined",
+        innerjoin=True,
+    )
 
     @property
     def deal_memo_id(self) -> str:
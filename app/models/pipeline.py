@@ -0,0 +1,23 @@
+"""
+Pipeline counter model - per-stage lead totals for the admin dashboard.
+
+Rows are maintained by the pipeline_counters_sync trigger on
+investor_profiles (see migration 008); the application only reads them.
+"""
+from sqlalchemy import BigInteger, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class PipelineCounter(Base):
+    """
+    Running lead count and lead-score sum for one pipeline stage.
+    Backs AdminStatsResponse.byStage and averageScore.
+    """
+
+    __tablename__ = "pipeline_counters"
+
+    stage: Mapped[str] = mapped_column(Text, primary_key=True)
+    n: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    lead_score_sum: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
@@ -22,7 +22,7 @@ interface DealMemo {
 import uuid
 from typing import TYPE_CHECKING, Any, List, Optional
 
-from sqlalchemy import ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import Enum, ForeignKey, Index, Integer, Numeric, String, Text, text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -32,6 +32,9 @@ if TYPE_CHECKING:
     from app.models.matching import DealMatch
 
 
+DEAL_STATUSES = ("active", "closed", "paused")
+
+
 class Property(Base, UUIDMixin, TimestampMixin):
     """
     Deal memo / property listing.
@@ -39,6 +42,16 @@ class Property(Base, UUIDMixin, TimestampMixin):
     """
 
     __tablename__ = "properties"
+    __table_args__ = (
+        # Array overlap/containment (&&, @>) for deal matching
+        Index("idx_properties_risk_factors_gin", "risk_factors", postgresql_using="gin"),
+        # Active-deal filters by type; closed/paused deals are never matched
+        Index(
+            "idx_properties_active_deal_type",
+            "deal_type",
+            postgresql_where=text("status = 'active'"),
+        ),
+    )
 
     # Basic info
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -57,7 +70,9 @@ class Property(Base, UUIDMixin, TimestampMixin):
     timeline: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
     # Status: 'active' | 'closed' | 'paused'
-    status: Mapped[str] = mapped_column(String(20), default="active", nullable=False)
+    status: Mapped[str] = mapped_column(
+        Enum(*DEAL_STATUSES, name="deal_status"), default="active", nullable=False
+    )
 
     # Location (optional, for extended use)
     address: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
@@ -79,12 +94,12 @@ class Property(Base, UUIDMixin, TimestampMixin):
         back_populates="property",
         uselist=False,
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     matches: Mapped[List["DealMatch"]] = relationship(
         back_populates="matched_property",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
 
@@ -95,6 +110,16 @@ class PropertyFeature(Base, UUIDMixin, TimestampMixin):
     """
 
     __tablename__ = "property_features"
+    __table_args__ = (
+        # jsonb_path_ops: smaller and faster than jsonb_ops for the @>
+        # containment queries matching runs (see search_by_features)
+        Index(
+            "idx_property_features_jsonb",
+            "features",
+            postgresql_using="gin",
+            postgresql_ops={"features": "jsonb_path_ops"},
+        ),
+    )
 
     property_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
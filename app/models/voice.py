@@ -13,10 +13,20 @@ interface CallRecord {
 }
 """
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    DateTime,
+    Double,
+    Enum,
+    ForeignKey,
+    Integer,
+    PrimaryKeyConstraint,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -26,6 +36,9 @@ if TYPE_CHECKING:
     from app.models.investor import InvestorProfile
 
 
+CALL_STATUSES = ("initiated", "ringing", "answered", "completed", "failed")
+
+
 class CallSession(Base, UUIDMixin):
     """
     Voice call record from LiveKit.
@@ -51,7 +64,9 @@ class CallSession(Base, UUIDMixin):
     )
 
     # Call status: 'initiated' | 'ringing' | 'answered' | 'completed' | 'failed'
-    status: Mapped[str] = mapped_column(String(50), default="initiated", nullable=False)
+    status: Mapped[str] = mapped_column(
+        Enum(*CALL_STATUSES, name="call_status"), default="initiated", nullable=False
+    )
 
     # Call details
     duration: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
@@ -83,11 +98,17 @@ class CallTranscript(Base, UUIDMixin):
     """
 
     __tablename__ = "call_transcripts"
+    # Hash-partitioned (16 partitions, see migration 015) so per-call reads
+    # touch one small partition; the partition key must be in the PK
+    __table_args__ = (
+        PrimaryKeyConstraint("call_session_id", "id"),
+        {"postgresql_partition_by": "HASH (call_session_id)"},
+    )
 
     call_session_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("call_sessions.id", ondelete="CASCADE"),
-        nullable=False,
+        primary_key=True,
     )
 
     # Speaker identification
@@ -97,14 +118,17 @@ class CallTranscript(Base, UUIDMixin):
     content: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Timing
-    start_time: Mapped[Optional[float]] = mapped_column(Integer, nullable=True)  # ms from start
-    end_time: Mapped[Optional[float]] = mapped_column(Integer, nullable=True)
+    start_time: Mapped[Optional[float]] = mapped_column(Double, nullable=True)  # ms from start
+    end_time: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
 
     # Confidence score from STT
-    confidence: Mapped[Optional[float]] = mapped_column(Integer, nullable=True)
+    confidence: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
 
+    # Stamped client-side so batched ORM inserts have nothing to fetch back
+    # (plain executemany, no RETURNING); COPY loads use the server default
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
         server_default=func.now(),
         nullable=False,
     )
@@ -0,0 +1,53 @@
+"""Pre-serialized JSON responses."""
+
+from typing import Any, Sequence, Type, TypeVar
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """
+    Serialize a response model once, in pydantic-core, and return it as-is.
+
+    FastAPI leaves a returned Response untouched, skipping response_model
+    re-validation and jsonable_encoder; response_model on the route then
+    only documents the schema. Fields are written under their aliases, as
+    FastAPI itself would.
+    """
+    return Response(
+        content=model.model_dump_json(by_alias=True),
+        media_type="application/json",
+        status_code=status_code,
+    )
+
+
+def list_response(
+    adapter: TypeAdapter[Any], key: str, items: Sequence[Any], **fields: Any
+) -> Response:
+    """
+    Return {key: items, **fields} with the items serialized by a prebuilt
+    list TypeAdapter and the scalar page fields appended with orjson.
+    """
+    body = b'{"' + key.encode() + b'":' + adapter.dump_json(items, by_alias=True)
+    body += b"," + orjson.dumps(fields)[1:] if fields else b"}"
+    return Response(content=body, media_type="application/json")
+
+
+def construct_trusted(model: Type[ModelT], **values: Any) -> ModelT:
+    """
+    Build a response model from trusted values by writing its __dict__.
+
+    Cheaper than model_construct, which walks every field to resolve aliases
+    and fill defaults: values must be keyed by field name and cover every
+    field. Only for response models without private attributes or extras.
+    """
+    obj = model.__new__(model)
+    object.__setattr__(obj, "__dict__", values)
+    object.__setattr__(obj, "__pydantic_fields_set__", set(values))
+    object.__setattr__(obj, "__pydantic_extra__", None)
+    object.__setattr__(obj, "__pydantic_private__", None)
+    return obj
@@ -1,5 +1,17 @@
 """API routers."""
 
+from enum import Enum
+from typing import List, Tuple, Union
+
+from fastapi import APIRouter
+
 from app.routers import admin, leads, properties
 
-__all__ = ["admin", "leads", "properties"]
+# (router, prefix, tags) in registration order; main.py includes each one
+ROUTERS: List[Tuple[APIRouter, str, List[Union[str, Enum]]]] = [
+    (leads.router, "/api/v1", ["leads"]),
+    (admin.router, "/api/v1/admin", ["admin"]),
+    (properties.router, "/api/v1/properties", ["properties"]),
+]
+
+__all__ = ["ROUTERS", "admin", "leads", "properties"]
@@ -4,6 +4,7 @@ Admin dashboard router.
 Handles:
 - GET /api/v1/admin/stats
 - GET /api/v1/admin/leads
+- GET /api/v1/admin/leads/export
 - GET /api/v1/admin/leads/{id}
 - PATCH /api/v1/admin/leads/{id}/stage
 - POST /api/v1/admin/leads/{id}/notes
@@ -11,18 +12,29 @@ Handles:
 - DELETE /api/v1/admin/auth (logout)
 """
 
-import math
+import asyncio
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.cache import ADMIN_STATS_KEY, response_cache
 from app.config import get_settings
-from app.db.repositories.investor_repo import InvestorRepository
+from app.db.pagination import decode_cursor, encode_cursor
+from app.db.repositories.investor_repo import (
+    SORT_VALUE_TYPES,
+    InvestorRepository,
+    SortBy,
+    SortOrder,
+)
 from app.db.repositories.property_repo import PropertyRepository
-from app.db.session import get_db
+from app.db.session import get_session_factory
+from app.dependencies import get_db_session_factory, get_investor_repo
+from app.models.investor import InvestorProfile, PipelineStage
+from app.responses import construct_trusted, list_response, model_response
 from app.schemas.admin import (
     ActivityItem,
     AdminStatsResponse,
@@ -30,31 +42,19 @@ from app.schemas.admin import (
     AuthResponse,
 )
 from app.schemas.investor import (
+    LEAD_LIST_ADAPTER,
     AddNoteRequest,
-    CallRecordResponse,
-    DealMatchResponse,
     InvestorQualificationResponse,
     LeadListResponse,
     LeadNoteResponse,
+    LeadSummaryResponse,
     LeadWithDetailsResponse,
-    StageChangeResponse,
     StageUpdateRequest,
 )
 
 router = APIRouter()
 settings = get_settings()
 
-# Valid pipeline stages
-VALID_STAGES = [
-    "new_lead",
-    "call_dispatched",
-    "call_completed",
-    "insights_extracted",
-    "deals_matched",
-    "under_review",
-    "closed",
-]
-
 
 @router.post("/auth", response_model=AuthResponse)
 async def login(
@@ -88,11 +88,14 @@ async def logout(response: Response) -> AuthResponse:
 
 @router.get("/stats", response_model=AdminStatsResponse)
 async def get_stats(
-    session: AsyncSession = Depends(get_db),
-) -> AdminStatsResponse:
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_db_session_factory),
+) -> Response:
     """
     Get admin dashboard statistics.
 
+    Served from the shared response cache for stats_response_ttl seconds;
+    lead submissions and stage changes invalidate it.
+
     Returns:
     - totalLeads: Total number of leads
     - byStage: Count per pipeline stage
@@ -100,19 +103,43 @@ async def get_stats(
     - totalDeals: Total active deals
     - recentActivity: Recent activity items
     """
-    investor_repo = InvestorRepository(session)
-    property_repo = PropertyRepository(session)
+    raw = await response_cache.get_or_compute(
+        ADMIN_STATS_KEY, lambda: _compute_stats(session_factory)
+    )
+    return Response(content=raw, media_type="application/json")
 
-    # Get stats
-    total_leads = await investor_repo.count()
-    by_stage = await investor_repo.get_stats_by_stage()
-    average_score = await investor_repo.get_average_score()
-    total_deals = await property_repo.count()
 
-    # Get recent leads for activity (mock activity for now)
-    recent_leads, _ = await investor_repo.search_leads(limit=5)
+async def _compute_stats(session_factory: async_sessionmaker[AsyncSession]) -> bytes:
+    """
+    Build the dashboard stats and serialize them for the response cache.
+
+    The five queries are independent, so each runs on its own session
+    (one AsyncSession can't multiplex) and they are awaited together.
+    """
+    async with (
+        session_factory() as s1,
+        session_factory() as s2,
+        session_factory() as s3,
+        session_factory() as s4,
+        session_factory() as s5,
+    ):
+        (
+            total_leads,
+            by_stage,
+            average_score,
+            total_deals,
+            (recent_leads, _),
+        ) = await asyncio.gather(
+            InvestorRepository(s1).count(),
+            InvestorRepository(s2).get_stats_by_stage(),
+            InvestorRepository(s3).get_average_score(),
+            PropertyRepository(s4).count(),
+            InvestorRepository(s5).search_leads(limit=5, include_total=False),
+        )
+
+    # Recent leads as activity (mock activity for now)
     recent_activity = [
-        ActivityItem(
+        ActivityItem.model_construct(
             id=str(lead.id),
             type="new_lead",
             message=f"New lead from {lead.phone[:6]}***",
@@ -121,19 +148,20 @@ async def get_stats(
         for lead in recent_leads
     ]
 
-    return AdminStatsResponse(
+    stats = AdminStatsResponse.model_construct(
         totalLeads=total_leads,
         byStage=by_stage,
         averageScore=round(average_score, 1),
         totalDeals=total_deals,
         recentActivity=recent_activity,
     )
+    return stats.model_dump_json(by_alias=True).encode()
 
 
 @router.get("/leads", response_model=LeadListResponse)
 async def list_leads(
-    session: AsyncSession = Depends(get_db),
-    stage: Optional[str] = Query(None),
+    repo: InvestorRepository = Depends(get_investor_repo),
+    stage: Optional[PipelineStage] = Query(None),
     score_min: Optional[int] = Query(None, alias="scoreMin"),
     score_max: Optional[int] = Query(None, alias="scoreMax"),
     capital_min: Optional[int] = Query(None, alias="capitalMin"),
@@ -141,11 +169,12 @@ async def list_leads(
     date_from: Optional[str] = Query(None, alias="dateFrom"),
     date_to: Optional[str] = Query(None, alias="dateTo"),
     search: Optional[str] = Query(None),
-    sort_by: str = Query("created_at", alias="sortBy"),
-    sort_order: str = Query("desc", alias="sortOrder"),
+    sort_by: SortBy = Query("created_at", alias="sortBy"),
+    sort_order: SortOrder = Query("desc", alias="sortOrder"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100, alias="pageSize"),
-) -> LeadListResponse:
+    cursor: Optional[str] = Query(None),
+) -> Response:
     """
     Get paginated list of leads with filters.
 
@@ -159,25 +188,37 @@ async def list_leads(
     - sortOrder: asc or desc
     - page: Page number (1-indexed)
     - pageSize: Items per page (max 100)
+    - cursor: nextCursor from the previous page (takes precedence over page)
     """
-    repo = InvestorRepository(session)
-
-    # Parse dates
+    # Parse dates (fromisoformat accepts a trailing "Z" since Python 3.11)
     date_from_dt = None
     date_to_dt = None
     if date_from:
         try:
-            date_from_dt = datetime.fromisoformat(date_from.replace("Z", "+00:00"))
+            date_from_dt = datetime.fromisoformat(date_from)
         except ValueError:
             pass
     if date_to:
         try:
-            date_to_dt = datetime.fromisoformat(date_to.replace("Z", "+00:00"))
+            date_to_dt = datetime.fromisoformat(date_to)
         except ValueError:
             pass
 
-    # Calculate offset
+    # Calculate offset, or resume from the cursor's keyset position
     skip = (page - 1) * page_size
+    sort_key = f"{sort_by}:{sort_order}"
+    after = None
+    if cursor:
+        try:
+            cursor_sort_key, sort_value, last_id = decode_cursor(cursor, SORT_VALUE_TYPES)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if cursor_sort_key != sort_key:
+            raise HTTPException(
+                status_code=400,
+                detail="Cursor was issued for a different sortBy/sortOrder",
+            )
+        after = (sort_value, last_id)
 
     # Search
     leads, total = await repo.search_leads(
@@ -193,84 +234,101 @@ async def list_leads(
         sort_order=sort_order,
         skip=skip,
         limit=page_size,
+        after=after,
     )
+    summaries = await repo.get_list_summaries([lead.id for lead in leads])
 
-    # Convert to response format
-    lead_responses = []
-    for lead in leads:
-        lead_response = _investor_to_response(lead)
-        lead_responses.append(lead_response)
+    next_cursor = None
+    if len(leads) == page_size:
+        next_cursor = encode_cursor(sort_key, *repo.cursor_for(leads[-1], sort_by))
 
-    total_pages = math.ceil(total / page_size) if total > 0 else 1
+    meta: Dict[str, Any] = {"page": page, "pageSize": page_size, "nextCursor": next_cursor}
+    # Cursor pages are not counted (see search_leads)
+    if total is not None:
+        meta["total"] = total
+        meta["totalPages"] = (total + page_size - 1) // page_size if total > 0 else 1
+    lead_responses = [_investor_to_summary(lead, *summaries[lead.id]) for lead in leads]
+    return list_response(LEAD_LIST_ADAPTER, "leads", lead_responses, **meta)
 
-    return LeadListResponse(
-        leads=lead_responses,
-        total=total,
-        page=page,
-        pageSize=page_size,
-        totalPages=total_pages,
-    )
+
+@router.get("/leads/export")
+async def export_leads(
+    stage: Optional[PipelineStage] = Query(None),
+) -> StreamingResponse:
+    """
+    Export the full pipeline as NDJSON.
+
+    One lead per line without calls/matches/notes/history. Rows are
+    streamed from a server-side cursor, so memory stays flat however many
+    leads there are. The generator opens its own session since it outlives
+    the request dependencies.
+    """
+    filters: Dict[str, Any] = {"stage": stage} if stage else {}
+
+    async def rows() -> AsyncIterator[str]:
+        async with get_session_factory()() as session:
+            repo = InvestorRepository(session)
+            async for lead in repo.iter_all(**filters):
+                row = _investor_to_export_row(lead)
+                yield row.model_dump_json(by_alias=True) + "\n"
+
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
 
 
 @router.get("/leads/{lead_id}", response_model=LeadWithDetailsResponse)
 async def get_lead(
     lead_id: uuid.UUID,
-    session: AsyncSession = Depends(get_db),
-) -> LeadWithDetailsResponse:
-    """Get single lead with full details."""
-    repo = InvestorRepository(session)
+    repo: InvestorRepository = Depends(get_investor_repo),
+) -> Response:
+    """
+    Get single lead with full details.
 
-    lead = await repo.get_with_relations(lead_id)
-    if not lead:
+    The JSON document is built by Postgres and returned as-is; response_model
+    only documents its shape.
+    """
+    lead_json = await repo.get_lead_json(lead_id)
+    if not lead_json:
         raise HTTPException(status_code=404, detail="Lead not found")
 
-    return _investor_to_response(lead)
+    return Response(content=lead_json, media_type="application/json")
 
 
 @router.patch("/leads/{lead_id}/stage", response_model=LeadWithDetailsResponse)
 async def update_lead_stage(
     lead_id: uuid.UUID,
     stage_data: StageUpdateRequest,
-    session: AsyncSession = Depends(get_db),
-) -> LeadWithDetailsResponse:
+    repo: InvestorRepository = Depends(get_investor_repo),
+) -> Response:
     """
     Update lead pipeline stage.
 
-    Validates stage is a valid PipelineStage value.
+    StageUpdateRequest only accepts PipelineStage values (422 otherwise).
     Records stage change in history.
     """
-    if stage_data.stage not in VALID_STAGES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid stage. Must be one of: {VALID_STAGES}",
-        )
-
-    repo = InvestorRepository(session)
-
-    lead = await repo.update_stage(
+    updated = await repo.update_stage(
         investor_id=lead_id,
         new_stage=stage_data.stage,
         changed_by="admin",
         notes=stage_data.notes,
     )
 
-    if not lead:
+    if not updated:
         raise HTTPException(status_code=404, detail="Lead not found")
 
     # Reload with relations
-    lead = await repo.get_with_relations(lead_id)
-    return _investor_to_response(lead)
+    lead_json = await repo.get_lead_json(lead_id)
+    await repo.session.commit()
+    await response_cache.invalidate(ADMIN_STATS_KEY)
+    return Response(content=lead_json, media_type="application/json")
 
 
 @router.post("/leads/{lead_id}/notes", response_model=LeadNoteResponse)
 async def add_lead_note(
     lead_id: uuid.UUID,
     note_data: AddNoteRequest,
-    session: AsyncSession = Depends(get_db),
-) -> LeadNoteResponse:
+    repo: InvestorRepository = Depends(get_investor_repo),
+) -> Response:
     """Add a note to a lead."""
-    repo = InvestorRepository(session)
-
     note = await repo.add_note(
         investor_id=lead_id,
         content=note_data.content,
@@ -279,21 +337,50 @@ async def add_lead_note(
 
     if not note:
         raise HTTPException(status_code=404, detail="Lead not found")
+    await repo.session.commit()
 
-    return LeadNoteResponse(
-        id=str(note.id),
-        content=note.content,
-        createdBy=note.created_by,
-        createdAt=note.created_at,
+    return model_response(
+        LeadNoteResponse.model_construct(
+            id=str(note.id),
+            content=note.content,
+            createdBy=note.created_by,
+            createdAt=note.created_at,
+        )
     )
 
 
-def _investor_to_response(lead) -> LeadWithDetailsResponse:
-    """Convert InvestorProfile model to response schema."""
+def _investor_to_summary(
+    lead: InvestorProfile, last_call_status: Optional[str], match_count: int
+) -> LeadSummaryResponse:
+    """Convert InvestorProfile model to its list row (trusted data, not validated)."""
+    return construct_trusted(
+        LeadSummaryResponse,
+        id=str(lead.id),
+        name=lead.name,
+        phone=lead.phone,
+        stage=lead.stage,
+        leadScore=lead.lead_score,
+        capitalAvailable=lead.capital_available,
+        createdAt=lead.created_at,
+        lastCallStatus=last_call_status,
+        matchCount=match_count,
+    )
+
+
+def _investor_to_export_row(lead: InvestorProfile) -> LeadWithDetailsResponse:
+    """
+    Convert InvestorProfile model to an export row: its own columns and
+    qualification, with the related lists left empty (not loaded).
+
+    Everything comes from typed ORM columns, so the row is built with
+    construct_trusted, skipping validation and model_construct's
+    per-field default handling.
+    """
     # Build qualification if present
     qualification = None
     if lead.investor_type and lead.qualification_bucket:
-        qualification = InvestorQualificationResponse(
+        qualification = construct_trusted(
+            InvestorQualificationResponse,
             investorType=lead.investor_type,
             capacity=lead.capacity or "",
             fit=lead.fit or "",
@@ -303,59 +390,8 @@ def _investor_to_response(lead) -> LeadWithDetailsResponse:
             bucket=lead.qualification_bucket,
         )
 
-    # Convert calls
-    calls = [
-        CallRecordResponse(
-            id=str(call.id),
-            status=call.status,
-            duration=call.duration,
-            transcript=call.transcript,
-            recordingUrl=call.recording_url,
-            initiatedAt=call.initiated_at,
-            completedAt=call.completed_at,
-        )
-        for call in (lead.calls or [])
-    ]
-
-    # Convert matches
-    matches = [
-        DealMatchResponse(
-            id=str(match.id),
-            dealMemoId=str(match.property_id),
-            dealName=match.property.name if match.property else "",
-            similarityScore=float(match.similarity_score),
-            matchReasons=match.match_reasons or [],
-            status=match.status,
-            createdAt=match.created_at,
-        )
-        for match in (lead.matches or [])
-    ]
-
-    # Convert notes
-    notes = [
-        LeadNoteResponse(
-            id=str(note.id),
-            content=note.content,
-            createdBy=note.created_by,
-            createdAt=note.created_at,
-        )
-        for note in (lead.notes or [])
-    ]
-
-    # Convert stage history
-    stage_history = [
-        StageChangeResponse(
-            id=str(change.id),
-            fromStage=change.from_stage,
-            toStage=change.to_stage,
-            changedBy=change.changed_by,
-            notes=change.notes,
-            changedAt=change.changed_at,
-        )
-        for change in (lead.stage_history or [])
-    ]
-
-    return LeadWithDetailsResponse(
+    return construct_trusted(
+        LeadWithDetailsResponse,
         id=str(lead.id),
         name=lead.name,
         phone=lead.phone,
@@ -369,9 +405,9 @@ def _investor_to_response(lead) -> LeadWithDetailsResponse:
         source=lead.source,
         createdAt=lead.created_at,
         updatedAt=lead.updated_at,
-        calls=calls,
-        matches=matches,
-        notes=notes,
-        stageHistory=stage_history,
+        calls=[],
+        matches=[],
+        notes=[],
+        stageHistory=[],
         qualification=qualification,
     )
@@ -4,49 +4,59 @@ Lead submission router.
 Handles POST /api/v1/submit-lead from chatbot.
 """
 
-import uuid
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Request
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 
+from app.cache import ADMIN_STATS_KEY, response_cache
 from app.db.repositories.investor_repo import InvestorRepository
-from app.db.session import get_db
-from app.models.consent import StageHistory
-from app.models.investor import InvestorProfile
+from app.dependencies import get_investor_repo
+from app.responses import model_response
 from app.schemas.lead import LeadSubmissionRequest, LeadSubmissionResponse
+from app.services.lead_processor import parse_capital_to_int
 
 router = APIRouter()
 
-
-def parse_capital(capital_str: Optional[str]) -> Optional[int]:
-    """Parse capital string like '$250K-$500K' to integer (midpoint)."""
-    if not capital_str:
-        return None
-
-    # Handle 'other:...' format
-    if capital_str.startswith("other:"):
-        return None
-
-    # Map known values to midpoint
-    capital_map = {
-        "$100K-$250K": 175000,
-        "$250K-$500K": 375000,
-        "$500K-$1M": 750000,
-        "$1M+": 1500000,
+# The body is read and validated by hand, so document it explicitly
+LEAD_SUBMISSION_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": LeadSubmissionRequest.model_json_schema()}},
     }
+}
 
-    return capital_map.get(capital_str)
 
+async def _parse_lead_submission(request: Request) -> LeadSubmissionRequest:
+    """
+    Validate the raw body straight into LeadSubmissionRequest.
 
-@router.post("/submit-lead", response_model=LeadSubmissionResponse)
+    model_validate_json parses and validates in one pydantic-core pass,
+    with no intermediate dict or per-field keyword plumbing.
+    """
+    try:
+        return LeadSubmissionRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        # Same 422 shape FastAPI produces for a declared body parameter,
+        # including the "body" prefix on each error location
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+        ) from e
+
+
+@router.post(
+    "/submit-lead",
+    response_model=LeadSubmissionResponse,
+    openapi_extra=LEAD_SUBMISSION_BODY,
+)
 async def submit_lead(
     request: Request,
-    lead_data: LeadSubmissionRequest,
-    session: AsyncSession = Depends(get_db),
+    lead_data: LeadSubmissionRequest = Depends(_parse_lead_submission),
+    repo: InvestorRepository = Depends(get_investor_repo),
     x_forwarded_for: Optional[str] = Header(None),
     user_agent: Optional[str] = Header(None),
-) -> LeadSubmissionResponse:
+) -> Response:
     """
     Accept lead from chatbot and create investor record.
 
@@ -65,31 +75,18 @@ async def submit_lead(
             detail="Consent is required for lead submission",
         )
 
-    repo = InvestorRepository(session)
-
-    # Check if phone already exists
-    existing = await repo.get_by_phone(lead_data.phoneNumber)
-    if existing:
-        # Return existing lead_id instead of creating duplicate
-        return LeadSubmissionResponse(
-            success=True,
-            message="Lead already exists",
-            leadId=str(existing.id),
-        )
-
     # Parse capital from qualification
     capital_available = None
     if lead_data.qualification:
-        capital_available = parse_capital(lead_data.qualification.capacity)
+        capital_available = parse_capital_to_int(lead_data.qualification.capacity)
     elif lead_data.capitalAvailable:
-        capital_available = parse_capital(lead_data.capitalAvailable)
+        capital_available = parse_capital_to_int(lead_data.capitalAvailable)
 
     # Parse investment preferences
     investment_preferences = lead_data.investmentPreferences or []
 
-    # Create investor profile
-    investor = InvestorProfile(
-        id=uuid.uuid4(),
+    # Investor profile columns
+    values = dict(
         phone=lead_data.phoneNumber,
         name=lead_data.name,
         timeline=lead_data.investmentTimeline,
@@ -102,41 +99,48 @@ async def submit_lead(
     # Add qualification data if present
     if lead_data.qualification:
         q = lead_data.qualification
-        investor.investor_type = q.investorType
-        investor.capacity = q.capacity
-        investor.fit = q.fit
-        investor.process = q.process
-        investor.timing = q.timing
-        investor.qualification_bucket = q.bucket
-        investor.qualification_score = q.score
-        investor.lead_score = q.score
-
-    # Save investor
-    investor = await repo.create(investor)
-
-    # Store consent record
+        values.update(
+            investor_type=q.investorType,
+            capacity=q.capacity,
+            fit=q.fit,
+            process=q.process,
+            timing=q.timing,
+            qualification_bucket=q.bucket,
+            qualification_score=q.score,
+            lead_score=q.score,
+        )
+
+    # Client address for the consent record
     ip_address = x_forwarded_for or (
         request.client.host if request.client else None
     )
-    await repo.add_consent(
-        investor_id=investor.id,
+
+    # Insert profile, consent and initial stage unless the phone already
+    # exists (single statement, race-free)
+    investor_id, created = await repo.create_with_consent(
+        values,
         consent_text="TCPA consent granted via web chatbot",
         ip_address=ip_address,
         user_agent=user_agent,
-    )
-
-    # Record initial stage
-    stage_change = StageHistory(
-        investor_id=investor.id,
-        from_stage=None,
-        to_stage="new_lead",
-        changed_by="system",
         notes="Lead submitted via chatbot",
     )
-    session.add(stage_change)
+    if not created:
+        # Return existing lead_id instead of creating duplicate
+        return model_response(
+            LeadSubmissionResponse(
+                success=True,
+                message="Lead already exists",
+                lead_id=str(investor_id),
+            )
+        )
+
+    await repo.session.commit()
+    await response_cache.invalidate(ADMIN_STATS_KEY)
 
-    return LeadSubmissionResponse(
-        success=True,
-        message="Lead submitted successfully",
-        leadId=str(investor.id),
+    return model_response(
+        LeadSubmissionResponse(
+            success=True,
+            message="Lead submitted successfully",
+            lead_id=str(investor_id),
+        )
     )
@@ -10,19 +10,32 @@ Handles:
 - POST /api/v1/properties/extract - Extract data from document
 """
 
+import base64
 import uuid
 from typing import Optional
 
-import boto3
 from botocore.exceptions import ClientError
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
 from app.db.repositories.property_repo import PropertyRepository
 from app.db.session import get_db
-from app.models.property import Property
+from app.dependencies import get_property_repo
+from app.models.property import DEAL_STATUSES, Property
+from app.responses import list_response, model_response
+from app.s3 import get_s3_client
 from app.schemas.property import (
+    DEAL_LIST_ADAPTER,
     DealCreateRequest,
     DealExtractionResponse,
     DealListResponse,
@@ -43,45 +56,78 @@ ALLOWED_CONTENT_TYPES = [
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 
 
-def get_s3_client():
-    """Get boto3 S3 client."""
-    return boto3.client(
-        "s3",
-        aws_access_key_id=settings.aws_access_key_id,
-        aws_secret_access_key=settings.aws_secret_access_key,
-        region_name=settings.aws_region,
+class FileTooLargeError(Exception):
+    """Raised by _SizeLimitedReader once more than its limit has been read."""
+
+
+class _SizeLimitedReader:
+    """
+    Async file-like wrapper that counts bytes as they are read and fails past
+    a limit, so a streamed upload never has to be buffered whole to check its
+    size. Reads go through UploadFile, which offloads disk I/O to a thread.
+    """
+
+    def __init__(self, upload: UploadFile, limit: int):
+        self._upload = upload
+        self._limit = limit
+        self._read = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        chunk = await self._upload.read(size)
+        self._read += len(chunk)
+        if self._read > self._limit:
+            raise FileTooLargeError()
+        return chunk
+
+
+def _new_upload_id() -> str:
+    """Random 128-bit id as unpadded base64url (22 chars vs 36 for a UUID string)."""
+    return base64.urlsafe_b64encode(uuid.uuid4().bytes).rstrip(b"=").decode()
+
+
+def _file_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=400,
+        detail=f"File too large. Max size: {MAX_FILE_SIZE // (1024*1024)}MB",
     )
 
 
 @router.get("", response_model=DealListResponse)
 async def list_deals(
-    session: AsyncSession = Depends(get_db),
+    repo: PropertyRepository = Depends(get_property_repo),
     status: Optional[str] = None,
-) -> DealListResponse:
-    """Get list of deals."""
-    repo = PropertyRepository(session)
+    page: int = Query(1, ge=1),
+    page_size: int = Query(100, ge=1, le=100, alias="pageSize"),
+) -> Response:
+    """
+    Get paginated list of deals (active deals unless status is given).
+
+    Only the requested page is fetched; total is counted server-side.
+    """
+    if status and status not in DEAL_STATUSES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid status. Must be one of: {list(DEAL_STATUSES)}",
+        )
 
-    if status:
-        deals = await repo.get_by_status(status)
-        total = len(deals)
-    else:
-        deals, total = await repo.get_active_deals()
+    deals, total = await repo.search_deals(
+        status=status or "active",
+        skip=(page - 1) * page_size,
+        limit=page_size,
+    )
 
     deal_responses = [_property_to_response(deal) for deal in deals]
 
-    return DealListResponse(deals=deal_responses, total=total)
+    return list_response(DEAL_LIST_ADAPTER, "deals", deal_responses, total=total)
 
 
 @router.post("", response_model=DealMemoResponse)
 async def create_deal(
     deal_data: DealCreateRequest,
-    session: AsyncSession = Depends(get_db),
-) -> DealMemoResponse:
+    repo: PropertyRepository = Depends(get_property_repo),
+) -> Response:
     """Create a new deal from extracted data."""
-    repo = PropertyRepository(session)
-
     property_obj = Property(
-        id=uuid.uuid4(),
         name=deal_data.name,
         deal_type=deal_data.dealType,
         summary=deal_data.summary,
@@ -96,33 +142,36 @@ async def create_deal(
     )
 
     property_obj = await repo.create(property_obj)
+    await repo.session.commit()
 
-    return _property_to_response(property_obj)
+    return model_response(_property_to_response(property_obj))
 
 
 @router.get("/{deal_id}", response_model=DealMemoResponse)
 async def get_deal(
     deal_id: uuid.UUID,
-    session: AsyncSession = Depends(get_db),
-) -> DealMemoResponse:
+    repo: PropertyRepository = Depends(get_property_repo),
+) -> Response:
     """Get single deal by ID."""
-    repo = PropertyRepository(session)
-
     deal = await repo.get(deal_id)
     if not deal:
         raise HTTPException(status_code=404, detail="Deal not found")
 
-    return _property_to_response(deal)
+    return model_response(_property_to_response(deal))
 
 
 @router.put("/{deal_id}", response_model=DealMemoResponse)
 async def update_deal(
     deal_id: uuid.UUID,
     deal_data: DealUpdateRequest,
-    session: AsyncSession = Depends(get_db),
-) -> DealMemoResponse:
+    repo: PropertyRepository = Depends(get_property_repo),
+) -> Response:
     """Update an existing deal."""
-    repo = PropertyRepository(session)
+    if deal_data.status is not None and deal_data.status not in DEAL_STATUSES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid status. Must be one of: {list(DEAL_STATUSES)}",
+        )
 
     deal = await repo.get(deal_id)
     if not deal:
@@ -153,15 +202,16 @@ async def update_deal(
         deal.status = deal_data.status
 
     deal = await repo.update(deal)
+    await repo.session.commit()
 
-    return _property_to_response(deal)
+    return model_response(_property_to_response(deal))
 
 
 @router.post("/upload", response_model=DealUploadResponse)
 async def upload_document(
     file: UploadFile = File(...),
     session: AsyncSession = Depends(get_db),
-) -> DealUploadResponse:
+) -> Response:
     """
     Upload a deal document (PDF or DOCX) to S3.
 
@@ -174,37 +224,38 @@ async def upload_document(
             detail=f"Invalid file type. Allowed: PDF, DOCX",
         )
 
-    # Read file
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Max size: {MAX_FILE_SIZE // (1024*1024)}MB",
-        )
+    # Reject oversized files up front when the size is known
+    if file.size is not None and file.size > MAX_FILE_SIZE:
+        raise _file_too_large()
 
     # Generate upload ID and S3 key
-    upload_id = str(uuid.uuid4())
+    upload_id = _new_upload_id()
     s3_key = f"uploads/{upload_id}/{file.filename}"
 
-    # Upload to S3
+    # Stream to S3 from the spooled temp file, chunk by chunk, without
+    # blocking the event loop
     try:
-        s3_client = get_s3_client()
-        s3_client.put_object(
-            Bucket=settings.aws_s3_bucket,
-            Key=s3_key,
-            Body=content,
-            ContentType=file.content_type,
+        s3_client = await get_s3_client()
+        await s3_client.upload_fileobj(
+            _SizeLimitedReader(file, MAX_FILE_SIZE),
+            settings.aws_s3_bucket,
+            s3_key,
+            ExtraArgs={"ContentType": file.content_type},
         )
+    except FileTooLargeError:
+        raise _file_too_large()
     except ClientError as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to upload to S3: {str(e)}",
         )
 
-    return DealUploadResponse(
-        uploadId=upload_id,
-        filename=file.filename or "document",
-        status="uploaded",
+    return model_response(
+        DealUploadResponse(
+            upload_id=upload_id,
+            filename=file.filename or "document",
+            status="uploaded",
+        )
     )
 
 
@@ -212,7 +263,7 @@ async def upload_document(
 async def extract_document(
     upload_id: str = Form(...),
     session: AsyncSession = Depends(get_db),
-) -> DealExtractionResponse:
+) -> Response:
     """
     Extract deal data from uploaded document using AI.
 
@@ -238,27 +289,29 @@ async def extract_document(
         rawText="[Document text would be extracted here]",
     )
 
-    return DealExtractionResponse(
-        extraction=extraction,
-        rawText="[Full document text]",
+    return model_response(
+        DealExtractionResponse(
+            extraction=extraction,
+            raw_text="[Full document text]",
+        )
     )
 
 
 def _property_to_response(deal: Property) -> DealMemoResponse:
-    """Convert Property model to response schema."""
-    return DealMemoResponse(
+    """Convert Property model to response schema (trusted data, not validated)."""
+    return DealMemoResponse.model_construct(
         id=str(deal.id),
         name=deal.name,
-        dealType=deal.deal_type,
+        deal_type=deal.deal_type,
         summary=deal.summary,
         thesis=deal.thesis,
-        minimumInvestment=deal.minimum_investment,
-        targetReturn=deal.target_return,
-        riskFactors=deal.risk_factors or [],
-        idealInvestorProfile=deal.ideal_investor_profile,
+        minimum_investment=deal.minimum_investment,
+        target_return=deal.target_return,
+        risk_factors=deal.risk_factors or [],
+        ideal_investor_profile=deal.ideal_investor_profile,
         structure=deal.structure,
         timeline=deal.timeline,
         status=deal.status,
-        createdAt=deal.created_at,
-        updatedAt=deal.updated_at,
+        created_at=deal.created_at,
+        updated_at=deal.updated_at,
     )
@@ -0,0 +1,47 @@
+"""Shared S3 client."""
+
+import asyncio
+from contextlib import AsyncExitStack
+from typing import Any, Optional
+
+import aioboto3
+
+from app.config import get_settings
+
+settings = get_settings()
+
+# Credentials are resolved once per process rather than per request
+s3_session = aioboto3.Session(
+    aws_access_key_id=settings.aws_access_key_id,
+    aws_secret_access_key=settings.aws_secret_access_key,
+    region_name=settings.aws_region,
+)
+
+_client: Optional[Any] = None
+_exit_stack: Optional[AsyncExitStack] = None
+_lock = asyncio.Lock()
+
+
+async def get_s3_client() -> Any:
+    """
+    Get the process-wide aioboto3 S3 client, creating it on first use.
+    The client keeps its connection pool open until close_s3_client().
+    """
+    global _client, _exit_stack
+    if _client is not None:
+        return _client
+    async with _lock:
+        if _client is None:
+            stack = AsyncExitStack()
+            _client = await stack.enter_async_context(s3_session.client("s3"))
+            _exit_stack = stack
+    return _client
+
+
+async def close_s3_client() -> None:
+    """Close the shared client (application shutdown)."""
+    global _client, _exit_stack
+    if _exit_stack is not None:
+        await _exit_stack.aclose()
+    _client = None
+    _exit_stack = None
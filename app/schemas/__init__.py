@@ -14,6 +14,7 @@ from app.schemas.investor import (
     InvestorQualificationResponse,
     LeadListResponse,
     LeadNoteResponse,
+    LeadSummaryResponse,
     LeadWithDetailsResponse,
     StageChangeResponse,
     StageUpdateRequest,
@@ -43,6 +44,7 @@ __all__ = [
     "CallRecordResponse",
     "DealMatchResponse",
     "LeadNoteResponse",
+    "LeadSummaryResponse",
     "StageChangeResponse",
     "LeadWithDetailsResponse",
     "LeadListResponse",
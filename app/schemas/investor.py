@@ -7,13 +7,16 @@ Maps to frontend types/lead.ts:
 - DealMatch
 - LeadNote
 - StageChange
+- LeadSummary
 - LeadListResponse
 """
 
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, Field, TypeAdapter
+
+from app.models.investor import PipelineStage
 
 
 class InvestorQualificationResponse(BaseModel):
@@ -52,10 +55,6 @@ class CallRecordResponse(BaseModel):
     initiatedAt: datetime
     completedAt: Optional[datetime] = None
 
-    @field_serializer("initiatedAt", "completedAt")
-    def serialize_datetime(self, dt: Optional[datetime]) -> Optional[str]:
-        return dt.isoformat() if dt else None
-
 
 class DealMatchResponse(BaseModel):
     """
@@ -81,10 +80,6 @@ class DealMatchResponse(BaseModel):
     status: str
     createdAt: datetime
 
-    @field_serializer("createdAt")
-    def serialize_datetime(self, dt: datetime) -> str:
-        return dt.isoformat()
-
 
 class LeadNoteResponse(BaseModel):
     """
@@ -104,10 +99,6 @@ class LeadNoteResponse(BaseModel):
     createdBy: str
     createdAt: datetime
 
-    @field_serializer("createdAt")
-    def serialize_datetime(self, dt: datetime) -> str:
-        return dt.isoformat()
-
 
 class StageChangeResponse(BaseModel):
     """
@@ -131,10 +122,6 @@ class StageChangeResponse(BaseModel):
     notes: Optional[str] = None
     changedAt: datetime
 
-    @field_serializer("changedAt")
-    def serialize_datetime(self, dt: datetime) -> str:
-        return dt.isoformat()
-
 
 class LeadWithDetailsResponse(BaseModel):
     """
@@ -181,9 +168,35 @@ class LeadWithDetailsResponse(BaseModel):
     stageHistory: List[StageChangeResponse] = Field(default_factory=list)
     qualification: Optional[InvestorQualificationResponse] = None
 
-    @field_serializer("createdAt", "updatedAt")
-    def serialize_datetime(self, dt: datetime) -> str:
-        return dt.isoformat()
+
+class LeadSummaryResponse(BaseModel):
+    """
+    Lead row for the paginated list. Flat, without the related lists; the
+    full record comes from GET /leads/{id}.
+
+    Maps to LeadSummary from frontend:
+    interface LeadSummary {
+      id: string
+      name: string
+      phone: string
+      stage: PipelineStage
+      leadScore: number
+      capitalAvailable?: number
+      createdAt: string
+      lastCallStatus?: string
+      matchCount: number
+    }
+    """
+
+    id: str
+    name: str
+    phone: str
+    stage: str
+    leadScore: int
+    capitalAvailable: Optional[int] = None
+    createdAt: datetime
+    lastCallStatus: Optional[str] = None
+    matchCount: int = 0
 
 
 class LeadListResponse(BaseModel):
@@ -192,25 +205,35 @@ class LeadListResponse(BaseModel):
 
     Maps to LeadListResponse from frontend:
     interface LeadListResponse {
-      leads: LeadWithDetails[]
-      total: number
+      leads: LeadSummary[]
+      total?: number
       page: number
       pageSize: number
-      totalPages: number
+      totalPages?: number
+      nextCursor?: string
     }
+
+    nextCursor is set when a further page may exist; pass it back as
+    `cursor` to fetch that page without an OFFSET scan. Pages fetched by
+    cursor omit total and totalPages rather than recount every match.
     """
 
-    leads: List[LeadWithDetailsResponse]
-    total: int
+    leads: List[LeadSummaryResponse]
+    total: Optional[int] = None
     page: int
     pageSize: int
-    totalPages: int
+    totalPages: Optional[int] = None
+    nextCursor: Optional[str] = None
+
+
+# Compiled once; serializes a page of leads without a LeadListResponse wrapper
+LEAD_LIST_ADAPTER = TypeAdapter(List[LeadSummaryResponse])
 
 
 class StageUpdateRequest(BaseModel):
-    """Request to update lead stage."""
+    """Request to update lead stage; unknown stages are rejected at parse time."""
 
-    stage: str
+    stage: PipelineStage
     notes: Optional[str] = None
 
 
@@ -10,6 +10,8 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from app.models.investor import QualificationBucket
+
 
 class QualificationData(BaseModel):
     """
@@ -31,7 +33,7 @@ class QualificationData(BaseModel):
     process: str
     timing: str
     score: int = Field(..., ge=0, le=100)
-    bucket: str
+    bucket: QualificationBucket
 
     class Config:
         populate_by_name = True
@@ -71,8 +73,7 @@ class LeadSubmissionResponse(BaseModel):
 
     success: bool
     message: str
-    leadId: str = Field(..., alias="lead_id")
+    lead_id: str
 
     class Config:
-        populate_by_name = True
         from_attributes = True
@@ -12,7 +12,7 @@ Maps to frontend types/deal.ts:
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class DealMemoResponse(BaseModel):
@@ -40,25 +40,20 @@ class DealMemoResponse(BaseModel):
 
     id: str
     name: str
-    dealType: str = Field(..., alias="deal_type")
+    deal_type: str
     summary: Optional[str] = None
     thesis: Optional[str] = None
-    minimumInvestment: Optional[int] = Field(None, alias="minimum_investment")
-    targetReturn: Optional[str] = Field(None, alias="target_return")
-    riskFactors: List[str] = Field(default_factory=list, alias="risk_factors")
-    idealInvestorProfile: Optional[str] = Field(None, alias="ideal_investor_profile")
+    minimum_investment: Optional[int] = None
+    target_return: Optional[str] = None
+    risk_factors: List[str] = Field(default_factory=list)
+    ideal_investor_profile: Optional[str] = None
     structure: Optional[str] = None
     timeline: Optional[str] = None
     status: str
-    createdAt: datetime = Field(..., alias="created_at")
-    updatedAt: datetime = Field(..., alias="updated_at")
-
-    @field_serializer("createdAt", "updatedAt")
-    def serialize_datetime(self, dt: datetime) -> str:
-        return dt.isoformat()
+    created_at: datetime
+    updated_at: datetime
 
     class Config:
-        populate_by_name = True
         from_attributes = True
 
 
@@ -80,7 +75,11 @@ class DealMemoExtraction(BaseModel):
       timeline: string
       confidence: number
       rawText: string
+      rawTextUrl?: string
     }
+
+    Full document text is stored in S3 and linked by rawTextUrl, leaving
+    rawText empty, so large memos stay out of every serialization pass.
     """
 
     name: str
@@ -95,6 +94,7 @@ class DealMemoExtraction(BaseModel):
     timeline: str
     confidence: float
     rawText: str = Field(..., alias="raw_text")
+    rawTextUrl: Optional[str] = Field(None, alias="raw_text_url")
 
     class Config:
         populate_by_name = True
@@ -112,13 +112,10 @@ class DealUploadResponse(BaseModel):
     }
     """
 
-    uploadId: str = Field(..., alias="upload_id")
+    upload_id: str
     filename: str
     status: str
 
-    class Config:
-        populate_by_name = True
-
 
 class DealExtractionResponse(BaseModel):
     """
@@ -132,10 +129,7 @@ class DealExtractionResponse(BaseModel):
     """
 
     extraction: DealMemoExtraction
-    rawText: str = Field(..., alias="raw_text")
-
-    class Config:
-        populate_by_name = True
+    raw_text: str
 
 
 class DealListResponse(BaseModel):
@@ -153,6 +147,10 @@ class DealListResponse(BaseModel):
     total: int
 
 
+# Compiled once; serializes a page of deals without a DealListResponse wrapper
+DEAL_LIST_ADAPTER = TypeAdapter(List[DealMemoResponse])
+
+
 class DealCreateRequest(BaseModel):
     """Request to create a new deal from extraction."""
 
@@ -4,15 +4,27 @@ Document extraction service.
 Uses OpenAI structured outputs to extract deal data from PDFs.
 """
 
-from typing import Optional
+import asyncio
+import hashlib
+from typing import List, Optional, Sequence, Type
 
-from openai import AsyncOpenAI
+import pypdfium2 as pdfium
+from botocore.exceptions import BotoCoreError, ClientError
+from openai import AsyncOpenAI, pydantic_function_tool
+from openai.types.shared_params import ResponseFormatJSONSchema
+from pydantic import BaseModel
 
+from app.cache import extraction_cache
 from app.config import get_settings
+from app.s3 import get_s3_client
 from app.schemas.property import DealMemoExtraction
 
 settings = get_settings()
 
+EXTRACTION_MODEL = "gpt-4o"
+# Bump when EXTRACTION_PROMPT or DealMemoExtraction changes, to retire cached results
+PROMPT_VERSION = "v2"
+
 # Extraction prompt for OpenAI
 EXTRACTION_PROMPT = """You are an expert at extracting structured data from real estate investment memorandums.
 
@@ -32,6 +44,41 @@ Be precise and extract actual values from the document. If a field is not found,
 
 Return confidence score (0-1) based on how much information was clearly extractable."""
 
+# Appended for multi-document requests so one copy of the prompt serves all
+BATCH_INSTRUCTIONS = """
+
+The user message contains several documents, each starting with its [index] and
+separated by ---. Return one extraction per document in `items`, in the same
+order as the documents."""
+
+
+class BatchedExtraction(BaseModel):
+    """Structured output for a multi-document extraction request."""
+
+    items: List[DealMemoExtraction]
+
+
+def _response_format(model: Type[BaseModel]) -> ResponseFormatJSONSchema:
+    """
+    Strict structured-output response_format for a model, as parse() builds it.
+    The strict schema comes from pydantic_function_tool, the public helper
+    that runs the same conversion.
+    """
+    function = pydantic_function_tool(model)["function"]
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": function["name"],
+            "schema": function["parameters"],
+            "strict": True,
+        },
+    }
+
+
+# Built once at import instead of on every completions.parse() call
+EXTRACTION_RESPONSE_FORMAT = _response_format(DealMemoExtraction)
+BATCH_RESPONSE_FORMAT = _response_format(BatchedExtraction)
+
 
 class ExtractionService:
     """Service for extracting deal data from documents."""
@@ -45,36 +92,88 @@ class ExtractionService:
         """
         Extract deal memo data from document text using OpenAI.
 
-        Uses structured outputs for guaranteed JSON schema compliance.
+        Uses structured outputs for guaranteed JSON schema compliance, with
+        the response_format schema prebuilt at import.
+        Results are cached by document hash, so re-uploads and retries of
+        the same text don't call OpenAI again; failed extractions aren't cached.
         """
+        cached = await _get_cached(document_text)
+        if cached is not None:
+            return cached
+
         try:
-            completion = await self.client.beta.chat.completions.parse(
-                model="gpt-4o",
+            completion = await self.client.chat.completions.create(
+                model=EXTRACTION_MODEL,
                 messages=[
                     {"role": "system", "content": EXTRACTION_PROMPT},
                     {"role": "user", "content": document_text},
                 ],
-                response_format=DealMemoExtraction,
+                response_format=EXTRACTION_RESPONSE_FORMAT,
             )
 
-            return completion.choices[0].message.parsed
+            extraction = DealMemoExtraction.model_validate_json(
+                completion.choices[0].message.content or ""
+            )
+            await _store_raw_text(document_text, extraction)
+            await _set_cached(document_text, extraction)
+            return extraction
 
         except Exception as e:
             # Return a default extraction on error
-            return DealMemoExtraction(
-                name="Untitled Deal",
-                dealType="unknown",
-                summary="Extraction failed. Please review manually.",
-                thesis="",
-                minimumInvestment=100000,
-                targetReturn="TBD",
-                riskFactors=["Extraction error - manual review needed"],
-                idealInvestorProfile="Accredited investors",
-                structure="LP/GP",
-                timeline="5-7 years",
-                confidence=0.0,
-                rawText=document_text[:1000] if document_text else "",
+            return _fallback_extraction(document_text)
+
+    async def extract_from_texts(
+        self, documents: Sequence[str]
+    ) -> List[DealMemoExtraction]:
+        """
+        Extract deal memo data from several documents in one OpenAI request.
+
+        The prompt is sent once for the whole batch instead of once per
+        document, and only documents missing from the cache are sent. If the
+        batch call fails or returns the wrong number of items, each document
+        is extracted on its own instead.
+        """
+        cached = await asyncio.gather(*(_get_cached(text) for text in documents))
+        misses = [i for i, result in enumerate(cached) if result is None]
+        if len(misses) <= 1:
+            extracted = [await self.extract_from_text(documents[i]) for i in misses]
+        else:
+            extracted = await self._extract_batch([documents[i] for i in misses])
+
+        filled = dict(zip(misses, extracted))
+        return [filled[i] if result is None else result for i, result in enumerate(cached)]
+
+    async def _extract_batch(self, documents: Sequence[str]) -> List[DealMemoExtraction]:
+        """Extract uncached documents in one request, falling back to one call each."""
+        batch_text = "\n\n---\n\n".join(
+            f"[{i}] {text}" for i, text in enumerate(documents)
+        )
+        try:
+            completion = await self.client.chat.completions.create(
+                model=EXTRACTION_MODEL,
+                messages=[
+                    {"role": "system", "content": EXTRACTION_PROMPT + BATCH_INSTRUCTIONS},
+                    {"role": "user", "content": batch_text},
+                ],
+                response_format=BATCH_RESPONSE_FORMAT,
             )
+            items = BatchedExtraction.model_validate_json(
+                completion.choices[0].message.content or ""
+            ).items
+            if len(items) == len(documents):
+                await asyncio.gather(
+                    *(_store_raw_text(text, item) for text, item in zip(documents, items))
+                )
+                await asyncio.gather(
+                    *(_set_cached(text, item) for text, item in zip(documents, items))
+                )
+                return items
+        except Exception:
+            pass
+
+        return list(
+            await asyncio.gather(*(self.extract_from_text(text) for text in documents))
+        )
 
     async def extract_from_pdf(
         self, pdf_content: bytes
@@ -82,12 +181,97 @@ class ExtractionService:
         """
         Extract deal memo data from PDF bytes.
 
-        TODO: Implement PDF parsing with PyPDF2 or similar.
+        Text extraction runs in a worker thread so the event loop keeps
+        serving other requests while pdfium parses the document.
         """
-        # Placeholder - would use pdf-parse or similar to extract text
-        # Then call extract_from_text
-        mock_text = "[PDF content would be extracted here]"
-        return await self.extract_from_text(mock_text)
+        document_text = await asyncio.to_thread(_pdf_to_text, pdf_content)
+        return await self.extract_from_text(document_text)
+
+
+def _pdf_to_text(pdf_content: bytes) -> str:
+    """Extract text page by page, releasing each page before the next."""
+    pdf = pdfium.PdfDocument(pdf_content)
+    try:
+        parts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            parts.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+        return "\n".join(parts)
+    finally:
+        pdf.close()
+
+
+def _cache_key(document_text: str) -> str:
+    digest = hashlib.sha256(
+        f"{EXTRACTION_MODEL}|{PROMPT_VERSION}|{document_text}".encode()
+    ).hexdigest()
+    return f"extraction:{digest}"
+
+
+async def _store_raw_text(document_text: str, extraction: DealMemoExtraction) -> None:
+    """
+    Move the full document text to S3 and link it from the extraction.
+
+    Keyed by content hash, so re-extracting a document overwrites the same
+    object. If S3 is unreachable or rejects the upload the text stays inline.
+    """
+    key = f"extractions/{hashlib.sha256(document_text.encode()).hexdigest()}.txt"
+    try:
+        s3_client = await get_s3_client()
+        await s3_client.put_object(
+            Bucket=settings.aws_s3_bucket,
+            Key=key,
+            Body=document_text.encode(),
+            ContentType="text/plain; charset=utf-8",
+        )
+        url = await s3_client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": settings.aws_s3_bucket, "Key": key},
+            ExpiresIn=settings.extraction_cache_ttl,
+        )
+    except (ClientError, BotoCoreError):
+        extraction.rawText = document_text
+        extraction.rawTextUrl = None
+        return
+    extraction.rawText = ""
+    extraction.rawTextUrl = url
+
+
+async def _get_cached(document_text: str) -> Optional[DealMemoExtraction]:
+    cached = await extraction_cache.get(_cache_key(document_text))
+    if cached is None:
+        return None
+    return DealMemoExtraction.model_validate_json(cached)
+
+
+async def _set_cached(document_text: str, extraction: DealMemoExtraction) -> None:
+    await extraction_cache.set(_cache_key(document_text), extraction.model_dump_json().encode())
+
+
+# Default extraction returned when OpenAI extraction fails; validated once
+_FALLBACK_EXTRACTION = DealMemoExtraction(
+    name="Untitled Deal",
+    dealType="unknown",
+    summary="Extraction failed. Please review manually.",
+    thesis="",
+    minimumInvestment=100000,
+    targetReturn="TBD",
+    riskFactors=["Extraction error - manual review needed"],
+    idealInvestorProfile="Accredited investors",
+    structure="LP/GP",
+    timeline="5-7 years",
+    confidence=0.0,
+    rawText="",
+)
+
+
+def _fallback_extraction(document_text: str) -> DealMemoExtraction:
+    """Copy of the fallback extraction carrying the start of the document."""
+    return _FALLBACK_EXTRACTION.model_copy(
+        update={"rawText": document_text[:1000] if document_text else ""}
+    )
 
 
 # Singleton instance
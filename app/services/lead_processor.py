@@ -12,10 +12,16 @@ import uuid
 from typing import Optional
 
 from app.db.repositories.investor_repo import InvestorRepository
-from app.models.consent import Consent, StageHistory
-from app.models.investor import InvestorProfile
 from app.schemas.lead import LeadSubmissionRequest
 
+# Frontend capacity options mapped to their midpoint; 'other:...' values miss
+CAPITAL_MAP = {
+    "$100K-$250K": 175000,
+    "$250K-$500K": 375000,
+    "$500K-$1M": 750000,
+    "$1M+": 1500000,
+}
+
 
 def parse_capital_to_int(capital_str: Optional[str]) -> Optional[int]:
     """
@@ -27,20 +33,7 @@ def parse_capital_to_int(capital_str: Optional[str]) -> Optional[int]:
     - '$500K-$1M' -> 750000
     - '$1M+' -> 1500000
     """
-    if not capital_str:
-        return None
-
-    if capital_str.startswith("other:"):
-        return None
-
-    capital_map = {
-        "$100K-$250K": 175000,
-        "$250K-$500K": 375000,
-        "$500K-$1M": 750000,
-        "$1M+": 1500000,
-    }
-
-    return capital_map.get(capital_str)
+    return CAPITAL_MAP.get(capital_str) if capital_str else None
 
 
 class LeadProcessor:
@@ -54,24 +47,16 @@ class LeadProcessor:
         lead_data: LeadSubmissionRequest,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
-    ) -> InvestorProfile:
+    ) -> uuid.UUID:
         """
         Process a new lead submission.
 
-        Steps:
-        1. Check for existing lead by phone
-        2. Create investor profile
-        3. Store TCPA consent
-        4. Record initial stage change
+        Creates the investor profile, TCPA consent and initial stage change
+        in one statement; an existing lead with the same phone is left as-is.
 
         Returns:
-            InvestorProfile: The created or existing investor
+            uuid.UUID: The id of the created or existing investor
         """
-        # Check for existing lead
-        existing = await self.investor_repo.get_by_phone(lead_data.phoneNumber)
-        if existing:
-            return existing
-
         # Parse capital
         capital_available = None
         if lead_data.qualification:
@@ -79,10 +64,10 @@ class LeadProcessor:
         elif lead_data.capitalAvailable:
             capital_available = parse_capital_to_int(lead_data.capitalAvailable)
 
-        # Create investor profile
-        investor = InvestorProfile(
-            id=uuid.uuid4(),
+        # Investor profile columns
+        values = dict(
             phone=lead_data.phoneNumber,
+            name=lead_data.name,
             timeline=lead_data.investmentTimeline,
             capital_available=capital_available,
             investment_preferences=lead_data.investmentPreferences or [],
@@ -93,27 +78,25 @@ class LeadProcessor:
         # Add qualification data
         if lead_data.qualification:
             q = lead_data.qualification
-            investor.investor_type = q.investorType
-            investor.capacity = q.capacity
-            investor.fit = q.fit
-            investor.process = q.process
-            investor.timing = q.timing
-            investor.qualification_bucket = q.bucket
-            investor.qualification_score = q.score
-            investor.lead_score = q.score
-
-        # Save investor
-        investor = await self.investor_repo.create(investor)
-
-        # Store consent
-        await self.investor_repo.add_consent(
-            investor_id=investor.id,
+            values.update(
+                investor_type=q.investorType,
+                capacity=q.capacity,
+                fit=q.fit,
+                process=q.process,
+                timing=q.timing,
+                qualification_bucket=q.bucket,
+                qualification_score=q.score,
+                lead_score=q.score,
+            )
+
+        investor_id, _ = await self.investor_repo.create_with_consent(
+            values,
             consent_text="TCPA consent granted via web chatbot",
             ip_address=ip_address,
             user_agent=user_agent,
+            notes="Lead submitted via chatbot",
         )
-
-        return investor
+        return investor_id
 
     async def dispatch_call(self, investor_id: uuid.UUID) -> Optional[str]:
         """
@@ -0,0 +1,127 @@
+"""Admin endpoint tests."""
+
+import base64
+import json
+
+from tests.conftest import requires_db
+from tests.test_leads import lead_payload
+
+pytestmark = requires_db
+
+
+async def create_lead(client) -> str:
+    response = await client.post("/api/v1/submit-lead", json=lead_payload())
+    assert response.status_code == 200
+    return response.json()["lead_id"]
+
+
+async def test_update_lead_stage_records_history(client):
+    lead_id = await create_lead(client)
+
+    response = await client.patch(
+        f"/api/v1/admin/leads/{lead_id}/stage",
+        json={"stage": "call_dispatched", "notes": "Dialing"},
+    )
+
+    assert response.status_code == 200
+    lead = response.json()
+    assert lead["stage"] == "call_dispatched"
+    latest = lead["stageHistory"][0]
+    assert (latest["fromStage"], latest["toStage"]) == ("new_lead", "call_dispatched")
+    assert latest["notes"] == "Dialing"
+
+
+async def test_update_lead_stage_missing_lead(client):
+    response = await client.patch(
+        "/api/v1/admin/leads/00000000-0000-7000-8000-000000000000/stage",
+        json={"stage": "closed"},
+    )
+
+    assert response.status_code == 404
+
+
+async def test_note_timestamps_match_between_note_and_lead_detail(client):
+    lead_id = await create_lead(client)
+
+    response = await client.post(
+        f"/api/v1/admin/leads/{lead_id}/notes", json={"content": "Call back Tuesday"}
+    )
+
+    assert response.status_code == 200
+    note = response.json()
+    assert note["content"] == "Call back Tuesday"
+    assert note["createdAt"].endswith("Z")
+
+    detail = (await client.get(f"/api/v1/admin/leads/{lead_id}")).json()
+    assert detail["notes"][0]["createdAt"] == note["createdAt"]
+    assert detail["createdAt"].endswith("Z")
+
+
+async def test_list_leads_large_page_is_one_json_document(client):
+    lead_id = await create_lead(client)
+
+    response = await client.get("/api/v1/admin/leads", params={"pageSize": 100})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert body["pageSize"] == 100
+    assert lead_id in [lead["id"] for lead in body["leads"]]
+
+
+async def test_stats_counts_leads(client):
+    await create_lead(client)
+
+    response = await client.get("/api/v1/admin/stats")
+
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["totalLeads"] >= 1
+    assert "new_lead" in stats["byStage"]
+
+
+async def test_stats_reflect_a_new_lead_immediately(client):
+    before = (await client.get("/api/v1/admin/stats")).json()
+
+    await create_lead(client)
+
+    after = (await client.get("/api/v1/admin/stats")).json()
+    assert after["totalLeads"] == before["totalLeads"] + 1
+    assert after["byStage"]["new_lead"] == before["byStage"].get("new_lead", 0) + 1
+
+
+async def test_list_leads_rejects_cursor_with_numeric_id(client):
+    cursor = base64.urlsafe_b64encode(b'["created_at:desc",5,123]').decode().rstrip("=")
+
+    response = await client.get("/api/v1/admin/leads", params={"cursor": cursor})
+
+    assert response.status_code == 400
+
+
+async def test_list_leads_cursor_pages_skip_the_count(client):
+    await create_lead(client)
+    await create_lead(client)
+
+    first = (await client.get("/api/v1/admin/leads", params={"pageSize": 1})).json()
+    response = await client.get(
+        "/api/v1/admin/leads", params={"pageSize": 1, "cursor": first["nextCursor"]}
+    )
+
+    assert first["total"] >= 2
+    assert response.status_code == 200
+    second = response.json()
+    assert "total" not in second and "totalPages" not in second
+    assert second["leads"][0]["id"] != first["leads"][0]["id"]
+
+
+async def test_export_leads_writes_one_row_per_lead(client):
+    lead_id = await create_lead(client)
+
+    response = await client.get("/api/v1/admin/leads/export", params={"stage": "new_lead"})
+
+    assert response.status_code == 200
+    rows = {row["id"]: row for row in map(json.loads, response.text.splitlines())}
+    row = rows[lead_id]
+    assert row["stage"] == "new_lead"
+    assert row["qualification"]["bucket"] == "active_intro"
+    assert row["calls"] == [] and row["stageHistory"] == []
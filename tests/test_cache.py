@@ -0,0 +1,53 @@
+"""In-process cache tests."""
+
+from types import SimpleNamespace
+
+from app import cache
+from app.cache import TTLCache
+from app.db.repositories.investor_repo import InvestorRepository
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    ttl_cache = TTLCache(ttl=60, max_size=2)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.get("a")
+
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.get("b") is None
+    assert ttl_cache.get("c") == 3
+
+
+def test_ttl_cache_prunes_expired_entries_on_set(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    ttl_cache = TTLCache(ttl=60)
+    for i in range(10):
+        ttl_cache.set(f"doc-{i}", i)
+
+    now[0] += 61
+    ttl_cache.set("fresh", 1)
+
+    assert list(ttl_cache._entries) == ["fresh"]
+
+
+class CountingSession:
+    def __init__(self):
+        self.executed = 0
+
+    async def execute(self, *args, **kwargs):
+        self.executed += 1
+        return SimpleNamespace(scalar_one=lambda: 250_000)
+
+
+async def test_row_estimate_is_cached_between_list_pages():
+    cache.row_estimate_cache.invalidate("investor_profiles")
+    session = CountingSession()
+    repo = InvestorRepository(session)
+
+    assert await repo.estimated_count() == 250_000
+    assert await repo.estimated_count() == 250_000
+    assert session.executed == 1
+    cache.row_estimate_cache.invalidate("investor_profiles")
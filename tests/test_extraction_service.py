@@ -0,0 +1,96 @@
+"""Extraction service tests (OpenAI and S3 are faked; no network)."""
+
+import uuid
+from types import SimpleNamespace
+
+from botocore.exceptions import NoCredentialsError
+
+from app.schemas.property import DealMemoExtraction
+from app.services import extraction_service
+from app.services.extraction_service import ExtractionService
+
+EXTRACTION = DealMemoExtraction(
+    name="Riverside Apartments",
+    dealType="multifamily",
+    summary="120-unit value-add.",
+    thesis="Below-market rents.",
+    minimumInvestment=50000,
+    targetReturn="16% IRR",
+    riskFactors=["Interest rate risk"],
+    idealInvestorProfile="Accredited investors",
+    structure="LP/GP",
+    timeline="5 years",
+    confidence=0.9,
+    rawText="",
+)
+
+
+class FakeCompletions:
+    def __init__(self, content: str):
+        self.content = content
+
+    async def create(self, **kwargs):
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def service_returning(extraction: DealMemoExtraction) -> ExtractionService:
+    service = ExtractionService()
+    service.client = SimpleNamespace(
+        chat=SimpleNamespace(completions=FakeCompletions(extraction.model_dump_json()))
+    )
+    return service
+
+
+class UnreachableS3:
+    async def put_object(self, **kwargs):
+        raise NoCredentialsError()
+
+
+async def test_extraction_survives_s3_errors(monkeypatch):
+    async def get_s3_client():
+        return UnreachableS3()
+
+    monkeypatch.setattr(extraction_service, "get_s3_client", get_s3_client)
+    document_text = f"Offering memorandum {uuid.uuid4()}"
+
+    extraction = await service_returning(EXTRACTION).extract_from_text(document_text)
+
+    assert extraction.name == "Riverside Apartments"
+    assert extraction.rawText == document_text
+    assert extraction.rawTextUrl is None
+
+
+def test_response_formats_are_strict_schemas():
+    for response_format, model in [
+        (extraction_service.EXTRACTION_RESPONSE_FORMAT, DealMemoExtraction),
+        (extraction_service.BATCH_RESPONSE_FORMAT, extraction_service.BatchedExtraction),
+    ]:
+        json_schema = response_format["json_schema"]
+        assert response_format["type"] == "json_schema"
+        assert json_schema["name"] == model.__name__
+        assert json_schema["strict"] is True
+        schema = json_schema["schema"]
+        assert schema["additionalProperties"] is False
+        assert set(schema["required"]) == set(schema["properties"])
+
+
+async def test_extract_from_texts_keeps_document_order(monkeypatch):
+    async def get_s3_client():
+        return UnreachableS3()
+
+    monkeypatch.setattr(extraction_service, "get_s3_client", get_s3_client)
+    documents = [f"Memo {name} {uuid.uuid4()}" for name in "ABC"]
+    cached = EXTRACTION.model_copy(update={"name": "A"})
+    await extraction_service._set_cached(documents[0], cached)
+    batch = extraction_service.BatchedExtraction(
+        items=[EXTRACTION.model_copy(update={"name": name}) for name in "BC"]
+    )
+    service = ExtractionService()
+    service.client = SimpleNamespace(
+        chat=SimpleNamespace(completions=FakeCompletions(batch.model_dump_json()))
+    )
+
+    extractions = await service.extract_from_texts(documents)
+
+    assert [extraction.name for extraction in extractions] == ["A", "B", "C"]
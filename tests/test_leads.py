@@ -0,0 +1,82 @@
+"""Lead intake endpoint tests."""
+
+import uuid
+
+from tests.conftest import requires_db
+
+pytestmark = requires_db
+
+
+def lead_payload(**overrides):
+    payload = {
+        "name": "Test Investor",
+        "phoneNumber": f"+1555{uuid.uuid4().int % 10**7:07d}",
+        "consent": True,
+        "timestamp": "2026-10-15T12:00:00Z",
+        "qualification": {
+            "investorType": "hnw",
+            "capacity": "$250K-$500K",
+            "fit": "high_priority",
+            "process": "meaningful_first",
+            "timing": "actively_deploying",
+            "score": 82,
+            "bucket": "active_intro",
+        },
+    }
+    payload.update(overrides)
+    return payload
+
+
+async def test_submit_lead_creates_lead_with_consent_and_history(client):
+    payload = lead_payload()
+
+    response = await client.post("/api/v1/submit-lead", json=payload)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is True
+    assert body["message"] == "Lead submitted successfully"
+    lead_id = body["lead_id"]
+
+    detail = await client.get(f"/api/v1/admin/leads/{lead_id}")
+    assert detail.status_code == 200
+    lead = detail.json()
+    assert lead["phone"] == payload["phoneNumber"]
+    assert lead["stage"] == "new_lead"
+    assert lead["capitalAvailable"] == 375000
+    assert lead["qualification"]["bucket"] == "active_intro"
+    assert [(h["fromStage"], h["toStage"]) for h in lead["stageHistory"]] == [
+        (None, "new_lead")
+    ]
+
+
+async def test_submit_lead_returns_existing_lead_for_same_phone(client):
+    payload = lead_payload()
+
+    first = await client.post("/api/v1/submit-lead", json=payload)
+    second = await client.post("/api/v1/submit-lead", json=payload)
+
+    assert second.status_code == 200
+    assert second.json()["message"] == "Lead already exists"
+    assert second.json()["lead_id"] == first.json()["lead_id"]
+
+
+async def test_submit_lead_rejects_unknown_bucket(client):
+    payload = lead_payload()
+    payload["qualification"]["bucket"] = "vip"
+
+    response = await client.post("/api/v1/submit-lead", json=payload)
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "qualification", "bucket"]
+
+
+async def test_submit_lead_rejects_malformed_json(client):
+    response = await client.post(
+        "/api/v1/submit-lead",
+        content=b"{not json",
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][0] == "body"
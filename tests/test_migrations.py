@@ -0,0 +1,62 @@
+"""Migration tests; each leaves the database at head."""
+
+import asyncio
+import uuid
+
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+
+from alembic import command
+from app.db.session import get_engine
+from tests.conftest import alembic_config, requires_db
+from tests.test_admin import create_lead
+
+pytestmark = requires_db
+
+
+async def migrate(direction, revision: str) -> None:
+    # env.py runs its own event loop, so it cannot share this one
+    await asyncio.to_thread(direction, alembic_config(), revision)
+
+
+async def count_consents(investor_id: uuid.UUID, table: str = "consents") -> int:
+    async with get_engine().connect() as conn:
+        result = await conn.execute(
+            text(f"SELECT count(*) FROM {table} WHERE investor_id = :id"), {"id": investor_id}
+        )
+        return result.scalar_one()
+
+
+async def test_upgrade_head_from_empty_database(migrated_db):
+    await migrate(command.downgrade, "base")
+    await migrate(command.upgrade, "head")
+
+    async with get_engine().connect() as conn:
+        current = (await conn.execute(text("SELECT version_num FROM alembic_version"))).scalar()
+    await get_engine().dispose()
+    assert current == ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+async def test_consent_dedup_archives_and_restores_duplicates(client):
+    investor_id = uuid.UUID(await create_lead(client))
+    await migrate(command.downgrade, "008_pipeline_counters")
+    try:
+        async with get_engine().begin() as conn:
+            await conn.execute(
+                text(
+                    "INSERT INTO consents (investor_id, consent_text, ip_address, user_agent,"
+                    " created_at)"
+                    " SELECT investor_id, consent_text, ip_address, user_agent,"
+                    " created_at + interval '1 second' FROM consents WHERE investor_id = :id"
+                ),
+                {"id": investor_id},
+            )
+
+        await migrate(command.upgrade, "009_consent_dedup")
+        assert await count_consents(investor_id) == 1
+        assert await count_consents(investor_id, "consents_duplicates_archive") == 1
+
+        await migrate(command.downgrade, "008_pipeline_counters")
+        assert await count_consents(investor_id) == 2
+    finally:
+        await migrate(command.upgrade, "head")
@@ -0,0 +1,41 @@
+"""Cursor encoding tests."""
+
+import base64
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from app.db.pagination import decode_cursor, encode_cursor
+from app.db.repositories.investor_repo import SORT_VALUE_TYPES
+
+
+def raw_cursor(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def test_cursor_round_trip():
+    id = uuid.uuid4()
+    created_at = datetime(2026, 10, 15, 12, tzinfo=timezone.utc)
+
+    cursor = encode_cursor("created_at:desc", created_at, id)
+
+    assert decode_cursor(cursor, SORT_VALUE_TYPES) == ("created_at:desc", created_at, id)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        ["created_at:desc", 5, 123],
+        ["created_at:desc", 5, str(uuid.uuid4())],
+        ["lead_score:desc", {"dt": "2026-10-15T12:00:00+00:00"}, str(uuid.uuid4())],
+        ["lead_score:desc", "80", str(uuid.uuid4())],
+        ["lead_score:desc", True, str(uuid.uuid4())],
+        ["unknown:desc", 5, str(uuid.uuid4())],
+        ["lead_score:desc", 5],
+    ],
+)
+def test_decode_rejects_malformed_cursors(payload):
+    with pytest.raises(ValueError):
+        decode_cursor(raw_cursor(payload), SORT_VALUE_TYPES)